@@ -8,12 +8,17 @@ do sistema KAIROS. Mantenha este arquivo seguro e não o compartilhe.
 """
 
 import os
+from functools import lru_cache
 
 # Função para obter a chave da API do Gemini
+@lru_cache(maxsize=1)
 def get_gemini_api_key() -> str:
     """
     Retorna a chave da API do Gemini a partir da variável de ambiente.
     
+    O valor é resolvido uma única vez e mantido em cache; use
+    refresh_api_key_cache() caso a variável de ambiente seja alterada.
+    
     Returns:
         str: Chave da API do Gemini
         
@@ -31,6 +36,7 @@ def get_gemini_api_key() -> str:
     return api_key
 
 # Validar se a chave está disponível
+@lru_cache(maxsize=1)
 def validate_gemini_key() -> bool:
     """
     Valida se a chave da API do Gemini está disponível e válida.
@@ -44,12 +50,30 @@ def validate_gemini_key() -> bool:
     except ValueError:
         return False
 
+def refresh_api_key_cache() -> None:
+    """
+    Invalida o cache da chave da API do Gemini.
+    
+    Útil quando a variável de ambiente GEMINI_API_KEY é alterada em tempo
+    de execução (por exemplo, em testes).
+    """
+    get_gemini_api_key.cache_clear()
+    validate_gemini_key.cache_clear()
+
 # Configurações adicionais para integração com Gemini
 GEMINI_CONFIG = {
     'model': 'gemini-1.5-flash',  # Modelo mais recente disponível
     'temperature': 0.7,
     'max_tokens': 2048,
-    'timeout': 30
+    'timeout': 30,
+    # Chamadas simultâneas em GeminiAnalyzer.analyze_many (ajuste ao limite da conta)
+    'max_concurrency': 4,
+    # Requisições por minuto nas chamadas assíncronas (None: sem limite além de max_concurrency)
+    'max_requests_per_minute': None,
+    # Intervalo (segundos) entre consultas ao estado de um job batch
+    'batch_poll_interval': 30,
+    # Segundos que uma resposta fica em cache para o mesmo prompt (0 desliga)
+    'cache_ttl': 600
 }
 
 if __name__ == "__main__":
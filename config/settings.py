@@ -6,10 +6,13 @@ Todas as configurações do sistema em um local centralizado
 """
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 # Diretórios do projeto
-PROJECT_ROOT = Path(__file__).parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SRC_DIR = PROJECT_ROOT / "src"
 MODULES_DIR = PROJECT_ROOT / "modules"
 UTILS_DIR = PROJECT_ROOT / "utils"
@@ -17,9 +20,11 @@ CONFIG_DIR = PROJECT_ROOT / "config"
 DATA_DIR = PROJECT_ROOT / "data"
 LOGS_DIR = PROJECT_ROOT / "logs"
 SCREENSHOTS_DIR = PROJECT_ROOT / "screenshots"
+CACHE_DIR = DATA_DIR / ".cache"
 
 # URLs e configurações do site
 BASE_URL = "https://www.excapper.com/"
+BASE_URL_IS_HTTP = BASE_URL.startswith('http')
 GAME_URL_TEMPLATE = "https://www.excapper.com/?action=game&id={game_id}"
 
 # Configurações do Playwright
@@ -29,7 +34,27 @@ PLAYWRIGHT_CONFIG = {
     'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'timeout': 30000,
     'wait_until': 'networkidle',
-    'args': ['--no-sandbox', '--disable-dev-shm-usage']
+    # A listagem aguarda explicitamente a tabela, então basta o DOM carregado
+    'list_wait_until': 'domcontentloaded',
+    # As páginas de jogos só esperam a resposta começar a chegar; a extração
+    # aguarda SELECTORS['ready'] (use 'domcontentloaded' se as tabelas chegarem
+    # incompletas com o seletor já presente)
+    'analysis_wait_until': 'commit',
+    'args': ['--no-sandbox', '--disable-dev-shm-usage'],
+    # Arquivo com cookies/armazenamento reaproveitados entre investigações (None desliga)
+    'storage_state_path': None,
+    # Recursos bloqueados na página de listagem (imagens e fontes voltam a
+    # carregar quando há screenshots; CSS é mantido pois afeta o innerText)
+    'blocked_resource_types': ['image', 'font', 'media'],
+    # Páginas de jogos: só o HTML das tabelas interessa (textContent não depende de CSS)
+    'analysis_blocked_resource_types': ['image', 'font', 'media', 'stylesheet'],
+    # Investigação detalhada: usa innerText, então o CSS continua carregando
+    'investigation_blocked_resource_types': ['image', 'font', 'media'],
+    # Domínios de rastreamento/anúncios sempre bloqueados nas páginas de jogos
+    'blocked_hosts': [
+        'googletagmanager.com', 'google-analytics.com', 'doubleclick.net',
+        'googlesyndication.com', 'facebook.net', 'hotjar.com'
+    ]
 }
 
 # Configurações de timeouts
@@ -55,6 +80,8 @@ MAIN_CONFIG = {
 SELECTORS = {
     'game_rows': 'tr.a_link',
     'tables': 'table',
+    # Elemento que indica que a página de um jogo está pronta para extração
+    'ready': 'table',
     'game_cells': 'td',
     'country_img': 'img',
     'navigation_tabs': '.tab, .nav-tab'
@@ -64,18 +91,71 @@ SELECTORS = {
 EXTRACTION_CONFIG = {
     'max_games_per_run': 200,
     'validate_links_sample': 3,
+    'validation_pool_size': 3,
+    'validation_http_concurrency': 20,
+    # Busca a lista de jogos via HTTP (httpx + selectolax) sem abrir o navegador
+    'http_list_fetch': False,
+    # Grava cada jogo numa linha JSONL durante a extração (+ arquivo .meta.json)
+    'stream_games_jsonl': False,
     'retry_attempts': 3,
     'delay_between_requests': 1,
     'save_screenshots': True,
+    'screenshot_quality': 80,
     'save_html': True,
     # Configurações para análise individual
     'max_individual_analysis': 10,
     'individual_analysis_delay': 2,
+    'individual_analysis_concurrency': 3,
+    # Contextos do navegador usados pela análise individual: com 1, todas as páginas
+    # compartilham o cache HTTP; com mais, as sessões ficam isoladas em rodízio
+    'individual_analysis_contexts': 1,
+    # Tenta baixar a página do jogo via HTTP (httpx + selectolax) antes de usar o navegador
+    'http_game_fetch': False,
     'extract_betting_tables': True,
     'extract_movement_history': True,
     'extract_additional_stats': True
 }
 
+# Configurações de investigação de jogos
+INVESTIGATION_CONFIG = {
+    'max_games_per_run': 50,
+    'wait_after_load': 2,
+    'delay_between_games': 2,
+    # Limite de páginas de jogos abertas por minuto, somando todos os workers;
+    # quando definido, substitui delay_between_games (None desliga)
+    'max_games_per_minute': None,
+    # Páginas investigando jogos em paralelo (arquivo de jogos e pipeline)
+    'file_workers': 4,
+    'pipeline_workers': 4,
+    'pipeline_queue_size': 64,
+    # Cada worker usa duas páginas: o próximo jogo carrega enquanto o atual
+    # aguarda wait_after_load e é extraído
+    'prefetch_next_game': False,
+    # Grava cada jogo investigado num arquivo JSONL assim que termina; o
+    # relatório final vira um .summary.json com metadados e falhas
+    'stream_results_jsonl': False,
+    # Grava também o HTML dos elementos (detailed_info e odds_info); só o
+    # texto é usado adiante e o HTML multiplica o tamanho dos resultados
+    'capture_html': False,
+    # Pula jogos cujo hash já foi investigado com sucesso (em data/investigated_hashes.txt);
+    # force_refresh investiga de novo mesmo assim, mantendo o registro
+    'skip_investigated': False,
+    'force_refresh': False
+}
+
+# Configurações de cache local (segundos)
+CACHE_CONFIG = {
+    'list_page_ttl': 60,
+    'link_status_ttl': 3600,
+    # Gravação/reprodução das respostas das páginas de jogos:
+    # 'off' (desligado), 'record' (sempre busca e grava), 'replay' (usa o que
+    # estiver gravado, sem gravar) ou 'auto' (usa se recente, senão busca e grava)
+    'http_cache_mode': 'off',
+    'http_cache_ttl': 86400,
+    # Parâmetros voláteis de URL ignorados na chave do cache
+    'http_cache_ignored_params': ['_', 't', 'ts', 'timestamp', 'cb']
+}
+
 # Configurações de arquivos
 FILE_CONFIG = {
     'encoding': 'utf-8',
@@ -88,14 +168,35 @@ FILE_CONFIG = {
 # Padrões de nomes de arquivos
 FILE_PATTERNS = {
     'games_data': 'games_data_{timestamp}.json',
+    'games_stream': 'games_data_{timestamp}.jsonl',
+    'games_metadata': 'games_data_{timestamp}.meta.json',
     'investigation_report': 'investigation_report_{timestamp}.json',
+    'investigation_stream': 'investigation_report_{timestamp}.jsonl',
+    'investigation_summary': 'investigation_report_{timestamp}.summary.json',
     'comparison_report': 'comparison_report_{timestamp}.json',
-    'screenshot_full': 'full_page_{timestamp}.png',
-    'screenshot_viewport': 'viewport_{timestamp}.png',
+    'screenshot_full': 'full_page_{timestamp}.jpg',
+    'screenshot_viewport': 'viewport_{timestamp}.jpg',
     'html_dump': 'page_dump_{timestamp}.html',
     'log_file': 'kairos_bot_{date}.log'
 }
 
+def _split_file_pattern(pattern):
+    """Separa um padrão de nome de arquivo em (prefixo, campo, sufixo)"""
+    prefix, _, rest = pattern.partition('{')
+    field, _, suffix = rest.partition('}')
+    return prefix, field, suffix
+
+# Padrões de nomes pré-processados (um único campo por padrão)
+COMPILED_FILE_PATTERNS = {
+    name: _split_file_pattern(pattern)
+    for name, pattern in FILE_PATTERNS.items()
+}
+
+def build_filename(pattern_name, value):
+    """Monta o nome de arquivo do padrão informado substituindo seu único campo"""
+    prefix, _, suffix = COMPILED_FILE_PATTERNS[pattern_name]
+    return f"{prefix}{value}{suffix}"
+
 # Configurações de logging
 LOGGING_CONFIG = {
     'level': 'INFO',
@@ -116,6 +217,12 @@ DATA_CONFIG = {
     }
 }
 
+# Regras de validação pré-compiladas
+COMPILED_VALIDATION_RULES = {
+    field: re.compile(pattern)
+    for field, pattern in DATA_CONFIG['validation_rules'].items()
+}
+
 # Configurações de performance
 PERFORMANCE_CONFIG = {
     'max_concurrent_requests': 5,
@@ -188,33 +295,43 @@ MESSAGES = {
 }
 
 # Função para criar diretórios necessários
+@lru_cache(maxsize=1)
 def ensure_directories():
-    """Cria todos os diretórios necessários se não existirem"""
+    """Cria todos os diretórios necessários se não existirem (uma vez por processo)"""
     directories = [DATA_DIR, LOGS_DIR, SCREENSHOTS_DIR]
     for directory in directories:
-        directory.mkdir(exist_ok=True)
+        if not os.path.isdir(directory):
+            directory.mkdir(exist_ok=True)
+
+# Configurações específicas por ambiente (somente leitura)
+_ENV_CONFIGS = {
+    'development': MappingProxyType({
+        'headless': False,
+        'timeout': 60000,
+        'log_level': 'DEBUG'
+    }),
+    'production': MappingProxyType({
+        'headless': True,
+        'timeout': 30000,
+        'log_level': 'INFO'
+    }),
+    'testing': MappingProxyType({
+        'headless': True,
+        'timeout': 15000,
+        'log_level': 'WARNING'
+    })
+}
 
 # Função para obter configuração por ambiente
+@lru_cache(maxsize=4)
 def get_config_by_env(env='production'):
-    """Retorna configurações específicas por ambiente"""
-    configs = {
-        'development': {
-            'headless': False,
-            'timeout': 60000,
-            'log_level': 'DEBUG'
-        },
-        'production': {
-            'headless': True,
-            'timeout': 30000,
-            'log_level': 'INFO'
-        },
-        'testing': {
-            'headless': True,
-            'timeout': 15000,
-            'log_level': 'WARNING'
-        }
-    }
-    return configs.get(env, configs['production'])
+    """Retorna configurações específicas por ambiente (mapeamento imutável)"""
+    return _ENV_CONFIGS.get(env, _ENV_CONFIGS['production'])
+
+# Função para obter o validador pré-compilado de um campo
+def get_validator(field):
+    """Retorna o padrão regex pré-compilado para o campo, ou None"""
+    return COMPILED_VALIDATION_RULES.get(field)
 
 # Validação de configurações
 def validate_config():
@@ -222,7 +339,7 @@ def validate_config():
     errors = []
     
     # Verifica se URLs são válidas
-    if not BASE_URL.startswith('http'):
+    if not BASE_URL_IS_HTTP:
         errors.append("BASE_URL deve começar com http ou https")
     
     # Verifica se diretórios podem ser criados
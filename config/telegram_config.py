@@ -6,6 +6,17 @@ Credenciais e configurações para notificações
 """
 
 import os
+import string
+from functools import lru_cache
+
+_ENV_KEYS = ('TELEGRAM_BOT_TOKEN', 'TELEGRAM_CHAT_ID')
+
+def _snapshot_env():
+    """Copia as variáveis do Telegram do ambiente para um dict simples"""
+    return {key: os.environ[key] for key in _ENV_KEYS if key in os.environ}
+
+# Snapshot das variáveis de ambiente feito uma única vez na importação
+_ENV_CACHE = _snapshot_env()
 
 # Configurações de mensagens
 MESSAGE_CONFIG = {
@@ -15,29 +26,79 @@ MESSAGE_CONFIG = {
     "parse_mode": "HTML"
 }
 
-# Templates de mensagens
-MESSAGE_TEMPLATES = {
-    "opportunity_alert": "🚨 <b>OPORTUNIDADE DETECTADA</b>\n\n🏆 <b>{teams}</b>\n🏟️ Liga: {league}\n📊 Mercado: {market_name}\n🎯 Seleção: {selection}\n💰 Odds: {odds}\n🤖 Confiança IA: {ai_confidence}%\n⏰ {timestamp}",
+# Templates de mensagens (construídos no primeiro acesso)
+@lru_cache(maxsize=1)
+def _build_message_templates():
+    """Constrói o dicionário de templates de mensagens"""
+    return {
+        "opportunity_alert": "🚨 <b>OPORTUNIDADE DETECTADA</b>\n\n🏆 <b>{teams}</b>\n🏟️ Liga: {league}\n📊 Mercado: {market_name}\n🎯 Seleção: {selection}\n💰 Odds: {odds}\n🤖 Confiança IA: {ai_confidence}%\n⏰ {timestamp}",
     
-    "analysis_summary": "📈 <b>RESUMO DA ANÁLISE</b>\n\n🎮 Total de jogos: {total_games}\n🎯 Oportunidades: {games_with_opportunities}\n⏰ Análise: {timestamp}\n\n{status_emoji} Status: Análise concluída",
+        "analysis_summary": "📈 <b>RESUMO DA ANÁLISE</b>\n\n🎮 Total de jogos: {total_games}\n🎯 Oportunidades: {games_with_opportunities}\n⏰ Análise: {timestamp}\n\n{status_emoji} Status: Análise concluída",
     
-    "error_alert": "🚨 <b>ERRO NO SISTEMA</b>\n\n❌ {error_message}\n⏰ {timestamp}\n\n🔧 Verificar logs para mais detalhes",
+        "error_alert": "🚨 <b>ERRO NO SISTEMA</b>\n\n❌ {error_message}\n⏰ {timestamp}\n\n🔧 Verificar logs para mais detalhes",
     
-    "system_start": "🤖 <b>KAIROS BOT INICIADO</b>\n\n✅ Sistema online\n📱 Telegram conectado\n🧠 IA configurada\n⏰ {timestamp}"
-}
+        "system_start": "🤖 <b>KAIROS BOT INICIADO</b>\n\n✅ Sistema online\n📱 Telegram conectado\n🧠 IA configurada\n⏰ {timestamp}"
+    }
 
+_CONVERSIONS = {'r': repr, 's': str, 'a': ascii}
+
+def _compile_template(template):
+    """Decompõe um template no formato str.format em segmentos pré-processados"""
+    return tuple(string.Formatter().parse(template))
+
+@lru_cache(maxsize=1)
+def _compiled_templates():
+    """Decompõe todos os templates uma única vez, no primeiro uso"""
+    return {name: _compile_template(template) for name, template in _build_message_templates().items()}
+
+def __getattr__(name):
+    """Carrega MESSAGE_TEMPLATES sob demanda (PEP 562)"""
+    if name == 'MESSAGE_TEMPLATES':
+        globals()[name] = _build_message_templates()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def render_template(name, **kwargs):
+    """
+    Renderiza um template de mensagem usando a versão pré-processada.
+    
+    Args:
+        name: Nome do template em MESSAGE_TEMPLATES
+        **kwargs: Valores dos campos do template
+        
+    Returns:
+        str: Mensagem formatada
+        
+    Raises:
+        KeyError: Se o template ou algum campo obrigatório não existir
+    """
+    parts = []
+    for literal, field, format_spec, conversion in _compiled_templates()[name]:
+        parts.append(literal)
+        if field is not None:
+            value = kwargs[field]
+            if conversion:
+                value = _CONVERSIONS[conversion](value)
+            parts.append(format(value, format_spec))
+    return ''.join(parts)
+
+@lru_cache(maxsize=1)
 def get_telegram_config():
     """
     Retorna configuração do Telegram carregada das variáveis de ambiente.
     
+    As variáveis são lidas do snapshot feito na importação do módulo e o
+    dicionário resultante é compartilhado entre as chamadas; use
+    refresh_env_cache() para recarregar após alterações no ambiente.
+    
     Returns:
         dict: Configuração completa do Telegram
         
     Raises:
         ValueError: Se as variáveis de ambiente não estiverem configuradas
     """
-    bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
-    chat_id = os.getenv('TELEGRAM_CHAT_ID')
+    bot_token = _ENV_CACHE.get('TELEGRAM_BOT_TOKEN')
+    chat_id = _ENV_CACHE.get('TELEGRAM_CHAT_ID')
     
     if not bot_token:
         raise ValueError(
@@ -55,5 +116,11 @@ def get_telegram_config():
         'bot_token': bot_token,
         'chat_id': chat_id,
         'message_config': MESSAGE_CONFIG,
-        'templates': MESSAGE_TEMPLATES
-    }
\ No newline at end of file
+        'templates': _build_message_templates()
+    }
+
+def refresh_env_cache():
+    """Recarrega o snapshot das variáveis de ambiente do Telegram"""
+    global _ENV_CACHE
+    _ENV_CACHE = _snapshot_env()
+    get_telegram_config.cache_clear()
\ No newline at end of file
@@ -6,25 +6,61 @@ Demonstra como integrar notificações Telegram no KAIROS BOT
 """
 
 import asyncio
-import sys
-from pathlib import Path
-
-# Adiciona o diretório raiz ao path
-sys.path.append(str(Path(__file__).parent))
+from typing import Optional
 
 from notifications.telegram_sender import TelegramSender, send_telegram_message, send_opportunity_notification
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Limite de exemplos enviando mensagens ao mesmo tempo (evita rate limit)
+MAX_ENVIOS_SIMULTANEOS = 2
+
+# Instância única do TelegramSender compartilhada entre os exemplos
+_SENDER: Optional[TelegramSender] = None
+_SENDER_LOCK: Optional[asyncio.Lock] = None
+
+async def get_sender() -> TelegramSender:
+    """
+    Retorna o TelegramSender compartilhado, criando-o no primeiro uso
+    """
+    global _SENDER, _SENDER_LOCK
+    
+    if _SENDER is None:
+        if _SENDER_LOCK is None:
+            _SENDER_LOCK = asyncio.Lock()
+        async with _SENDER_LOCK:
+            # Outro exemplo pode ter criado o sender enquanto aguardávamos
+            if _SENDER is None:
+                _SENDER = TelegramSender()
+    
+    return _SENDER
+
+async def close_sender():
+    """
+    Encerra o TelegramSender compartilhado, se existir
+    """
+    global _SENDER
+    
+    if _SENDER is not None:
+        await _SENDER.close()
+        _SENDER = None
+
 async def exemplo_basico():
     """
     Exemplo básico de envio de mensagem
     """
     print("\n🔹 Exemplo 1: Mensagem Básica")
     
-    # Método 1: Usando a função de conveniência
-    sucesso = await send_telegram_message("🧪 <b>Teste Básico</b>\n\n✅ Mensagem enviada via função de conveniência!")
+    try:
+        # Método 1: Usando a função de conveniência
+        sucesso = await send_telegram_message(
+            "🧪 <b>Teste Básico</b>\n\n✅ Mensagem enviada via função de conveniência!",
+            sender=await get_sender()
+        )
+    except Exception as e:
+        logger.error(f"Erro no exemplo: {e}")
+        sucesso = False
     
     if sucesso:
         print("✅ Mensagem básica enviada com sucesso")
@@ -38,8 +74,8 @@ async def exemplo_classe_completa():
     print("\n🔹 Exemplo 2: Classe Completa")
     
     try:
-        # Criar instância do sender
-        sender = TelegramSender()
+        # Obter instância compartilhada do sender
+        sender = await get_sender()
         
         # Testar conexão
         if await sender.test_connection():
@@ -88,7 +124,11 @@ async def exemplo_oportunidade():
     }
     
     # Enviar notificação
-    sucesso = await send_opportunity_notification(game_info, opportunity)
+    try:
+        sucesso = await send_opportunity_notification(game_info, opportunity, sender=await get_sender())
+    except Exception as e:
+        logger.error(f"Erro no exemplo: {e}")
+        sucesso = False
     
     if sucesso:
         print("✅ Oportunidade enviada com sucesso")
@@ -102,7 +142,7 @@ async def exemplo_erro():
     print("\n🔹 Exemplo 4: Notificação de Erro")
     
     try:
-        sender = TelegramSender()
+        sender = await get_sender()
         
         # Simular um erro
         error_message = "Falha na conexão com o site excapper.com - Timeout após 30s"
@@ -138,13 +178,24 @@ async def exemplo_personalizado():
 ⏰ Próxima análise em 30 minutos
     """
     
-    sucesso = await send_telegram_message(mensagem_personalizada)
+    try:
+        sucesso = await send_telegram_message(mensagem_personalizada, sender=await get_sender())
+    except Exception as e:
+        logger.error(f"Erro no exemplo: {e}")
+        sucesso = False
     
     if sucesso:
         print("✅ Mensagem personalizada enviada")
     else:
         print("❌ Falha ao enviar mensagem personalizada")
 
+async def _executar_limitado(semaforo, exemplo):
+    """
+    Executa um exemplo respeitando o limite de envios simultâneos
+    """
+    async with semaforo:
+        await exemplo()
+
 async def main():
     """
     Função principal - executa todos os exemplos
@@ -153,20 +204,15 @@ async def main():
     print("=" * 50)
     
     try:
-        # Executar exemplos em sequência
-        await exemplo_basico()
-        await asyncio.sleep(1)
-        
-        await exemplo_classe_completa()
-        await asyncio.sleep(1)
-        
-        await exemplo_oportunidade()
-        await asyncio.sleep(1)
-        
-        await exemplo_erro()
-        await asyncio.sleep(1)
-        
-        await exemplo_personalizado()
+        # Executar exemplos em paralelo, limitando envios simultâneos
+        semaforo = asyncio.Semaphore(MAX_ENVIOS_SIMULTANEOS)
+        await asyncio.gather(
+            _executar_limitado(semaforo, exemplo_basico),
+            _executar_limitado(semaforo, exemplo_classe_completa),
+            _executar_limitado(semaforo, exemplo_oportunidade),
+            _executar_limitado(semaforo, exemplo_erro),
+            _executar_limitado(semaforo, exemplo_personalizado)
+        )
         
         print("\n" + "=" * 50)
         print("✅ Todos os exemplos executados com sucesso!")
@@ -182,6 +228,8 @@ async def main():
     except Exception as e:
         logger.error(f"Erro na execução: {e}")
         print(f"❌ Erro na execução: {e}")
+    finally:
+        await close_sender()
 
 if __name__ == "__main__":
     # Executar exemplos
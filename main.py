@@ -6,28 +6,47 @@ Sistema de análise de oportunidades de apostas esportivas
 """
 
 import asyncio
+import signal
 import sys
 import argparse
-from pathlib import Path
 
-# Adiciona o diretório raiz ao path
-sys.path.append(str(Path(__file__).parent))
-
-from scraper.excapper_scraper import run_excapper_analysis
-from notifications.telegram_sender import TelegramSender as TelegramNotifier
 from utils.logger import get_logger
+from utils.helpers import current_timestamp
+from utils.rate_limiter import AsyncRateLimiter
+from utils.playwright_patch import apply_playwright_fast_patch
 from config.api_keys import validate_gemini_key
 from config.telegram_config import get_telegram_config
-import os
 from datetime import datetime
 
 logger = get_logger(__name__)
 
+# Mensagens Telegram por minuto para o mesmo chat: o limite de ~30 msg/s é
+# global do bot; um grupo/canal aceita cerca de 20 por minuto
+ALERTS_PER_MINUTE = 20
+
+# Banner exibido ao iniciar (montado uma vez e escrito de uma só vez)
+_SEPARATOR = "=" * 60
+_BANNER = (
+    "\n" + _SEPARATOR + "\n"
+    "🤖 KAIROS BOT - Sistema Inteligente de Análise\n"
+    + _SEPARATOR + "\n"
+    "📅 Iniciado em: {started_at}\n"
+    "🔧 Modo: {mode}\n"
+    "📱 Telegram: {telegram}\n"
+    "🧠 Gemini AI: {gemini}\n"
+    + _SEPARATOR + "\n\n"
+)
+
 
 async def run_kairos_analysis(telegram_config=None):
     """Executa análise completa KAIROS com notificações Telegram"""
     logger.info("🚀 Iniciando análise KAIROS completa...")
     
+    # Importações pesadas (Playwright, Telegram, Gemini) apenas quando necessárias
+    apply_playwright_fast_patch()
+    from scraper.excapper_scraper import run_excapper_analysis
+    from notifications.telegram_sender import TelegramSender as TelegramNotifier
+    
     # Configurar notificador Telegram se fornecido
     telegram_notifier = None
     if telegram_config:
@@ -55,7 +74,7 @@ async def run_kairos_analysis(telegram_config=None):
     except Exception as e:
         logger.error(f"❌ Erro na análise KAIROS: {e}")
         if telegram_notifier:
-            error_msg = f"🚨 <b>ERRO KAIROS</b>\n\n❌ {str(e)}\n⏰ {datetime.now().strftime('%H:%M:%S')}"
+            error_msg = f"🚨 <b>ERRO KAIROS</b>\n\n❌ {str(e)}\n⏰ {current_timestamp('time_only')}"
             await telegram_notifier.send_message(error_msg)
         raise
     finally:
@@ -85,41 +104,76 @@ async def process_results_and_notify(results, telegram_notifier):
         'timestamp': datetime.now().isoformat()
     }
     
-    await telegram_notifier.send_analysis_summary(summary)
+    # O resumo e os alertas vão para o mesmo chat e dividem o mesmo limite;
+    # acima dele o Telegram responde 429 e os alertas podem ser descartados
+    limiter = AsyncRateLimiter(ALERTS_PER_MINUTE, 60)
     
-    # Enviar alertas de oportunidades individuais
-    for game in processed_games:
-        if game.get('has_prediction') and game.get('ai_confidence', 0) > 60:
-            game_info = {
-                'teams': game.get('teams', 'N/A'),
-                'league': game.get('league', 'N/A')
-            }
-            
-            opportunity = {
-                'market_name': 'Análise KAIROS',
-                'selection': 'Oportunidade Detectada',
-                'odds': 'N/A',
-                'ai_confidence': game.get('ai_confidence', 0)
-            }
-            
+    async with limiter:
+        await telegram_notifier.send_analysis_summary(summary)
+    
+    # Enviar alertas de oportunidades individuais, espaçados pelo limitador
+    
+    async def send_alert(game):
+        game_info = {
+            'teams': game.get('teams', 'N/A'),
+            'league': game.get('league', 'N/A')
+        }
+        
+        opportunity = {
+            'market_name': 'Análise KAIROS',
+            'selection': 'Oportunidade Detectada',
+            'odds': 'N/A',
+            'ai_confidence': game.get('ai_confidence', 0)
+        }
+        
+        async with limiter:
             await telegram_notifier.send_opportunity_alert(game_info, opportunity)
-            await asyncio.sleep(1)  # Evitar spam
+    
+    await asyncio.gather(*[
+        send_alert(game) for game in processed_games
+        if game.get('has_prediction') and game.get('ai_confidence', 0) > 60
+    ])
 
 async def run_continuous_monitoring(telegram_config=None, interval_minutes=30):
     """Executa monitoramento contínuo com intervalo configurável"""
     logger.info(f"🔄 Iniciando monitoramento contínuo (intervalo: {interval_minutes} min)")
     
-    while True:
+    shutdown = install_shutdown_handlers()
+    
+    while not shutdown.is_set():
         try:
             await run_kairos_analysis(telegram_config)
             logger.info(f"⏰ Próxima análise em {interval_minutes} minutos")
-            await asyncio.sleep(interval_minutes * 60)
+            await wait_or_shutdown(shutdown, interval_minutes * 60)
         except KeyboardInterrupt:
             logger.info("🛑 Monitoramento interrompido pelo usuário")
             break
         except Exception as e:
             logger.error(f"❌ Erro no monitoramento: {e}")
-            await asyncio.sleep(60)  # Aguardar 1 minuto antes de tentar novamente
+            await wait_or_shutdown(shutdown, 60)  # Aguardar 1 minuto antes de tentar novamente
+    
+    logger.info("🛑 Monitoramento finalizado")
+
+def install_shutdown_handlers():
+    """Cria um evento de desligamento acionado por SIGTERM/SIGINT"""
+    shutdown = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, shutdown.set)
+        except (NotImplementedError, RuntimeError):
+            # Windows não suporta add_signal_handler; Ctrl+C segue via KeyboardInterrupt
+            pass
+    
+    return shutdown
+
+async def wait_or_shutdown(shutdown, timeout):
+    """Aguarda o intervalo ou até o evento de desligamento ser acionado"""
+    try:
+        await asyncio.wait_for(shutdown.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
 
 def load_telegram_config():
     """Carrega configuração do Telegram"""
@@ -159,19 +213,19 @@ async def main():
         else:
             logger.info("✅ Configuração Telegram carregada com sucesso")
     
-    # Verificar Gemini AI
-    if not validate_gemini_key():
+    # Verificar Gemini AI (uma única vez; o resultado é reutilizado no banner)
+    gemini_ok = validate_gemini_key()
+    if not gemini_ok:
         logger.warning("⚠️ Chave Gemini AI não configurada. Algumas funcionalidades podem estar limitadas.")
     
     try:
-        print("\n" + "="*60)
-        print("🤖 KAIROS BOT - Sistema Inteligente de Análise")
-        print("="*60)
-        print(f"📅 Iniciado em: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
-        print(f"🔧 Modo: {args.mode.upper()}")
-        print(f"📱 Telegram: {'✅ Ativo' if telegram_config else '❌ Inativo'}")
-        print(f"🧠 Gemini AI: {'✅ Ativo' if validate_gemini_key() else '❌ Inativo'}")
-        print("="*60 + "\n")
+        sys.stdout.write(_BANNER.format(
+            started_at=current_timestamp('display'),
+            mode=args.mode.upper(),
+            telegram='✅ Ativo' if telegram_config else '❌ Inativo',
+            gemini='✅ Ativo' if gemini_ok else '❌ Inativo'
+        ))
+        sys.stdout.flush()
         
         if args.mode == 'single':
             await run_kairos_analysis(telegram_config)
@@ -192,5 +246,12 @@ if __name__ == "__main__":
         print("❌ Python 3.7+ é necessário")
         sys.exit(1)
     
+    # Usa o event loop do uvloop quando disponível (Linux/macOS)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Executa função principal
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+KAIROS BOT - Pool de Navegador
+Mantém um único Chromium aberto e compartilhado entre as análises
+"""
+
+import asyncio
+from typing import Optional
+
+from playwright.async_api import async_playwright, Browser, Playwright
+
+from config.settings import PLAYWRIGHT_CONFIG
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_PLAYWRIGHT: Optional[Playwright] = None
+_BROWSER: Optional[Browser] = None
+_BROWSER_LOCK: Optional[asyncio.Lock] = None
+
+async def get_browser() -> Browser:
+    """Retorna o navegador compartilhado, iniciando-o no primeiro uso"""
+    global _PLAYWRIGHT, _BROWSER, _BROWSER_LOCK
+    
+    if _BROWSER is None or not _BROWSER.is_connected():
+        if _BROWSER_LOCK is None:
+            _BROWSER_LOCK = asyncio.Lock()
+        async with _BROWSER_LOCK:
+            # Outra tarefa pode ter iniciado o navegador enquanto aguardávamos
+            if _BROWSER is None or not _BROWSER.is_connected():
+                if _PLAYWRIGHT is None:
+                    _PLAYWRIGHT = await async_playwright().start()
+                _BROWSER = await _PLAYWRIGHT.chromium.launch(
+                    headless=PLAYWRIGHT_CONFIG['headless'],
+                    args=PLAYWRIGHT_CONFIG['args']
+                )
+                logger.info("🚀 Navegador compartilhado iniciado")
+    
+    return _BROWSER
+
+async def shutdown_pool():
+    """Fecha o navegador compartilhado (chamar ao final da aplicação)"""
+    global _PLAYWRIGHT, _BROWSER
+    
+    if _BROWSER is not None:
+        await _BROWSER.close()
+        _BROWSER = None
+        logger.info("🧹 Navegador compartilhado fechado")
+    
+    if _PLAYWRIGHT is not None:
+        await _PLAYWRIGHT.stop()
+        _PLAYWRIGHT = None
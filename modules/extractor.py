@@ -6,8 +6,6 @@ Extrai dados dos jogos do site Excapper
 """
 
 import asyncio
-import json
-import re
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urljoin
@@ -15,12 +13,84 @@ from playwright.async_api import async_playwright
 
 from config.settings import (
     BASE_URL, PLAYWRIGHT_CONFIG, TIMEOUTS, SELECTORS,
-    EXTRACTION_CONFIG, FILE_CONFIG, FILE_PATTERNS,
-    DATA_CONFIG, MESSAGES, DATA_DIR, SCREENSHOTS_DIR
+    EXTRACTION_CONFIG, CACHE_CONFIG,
+    DATA_CONFIG, MESSAGES, DATA_DIR, SCREENSHOTS_DIR,
+    build_filename
 )
 from utils.logger import get_logger
-from utils.helpers import format_timestamp, validate_game_data
+from utils.cache import get_cached, set_cached, load_link_statuses, save_link_statuses
+from utils.helpers import format_timestamp, validate_game_data, save_json_file, dump_json_line
 from modules.game_analyzer import GameAnalyzer
+from modules._browser_pool import shutdown_pool
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HTTP_FETCH_AVAILABLE = HTTPX_AVAILABLE
+except ImportError:
+    HTTP_FETCH_AVAILABLE = False
+
+# Caracteres aceitos no valor monetário da coluna de volume (ex.: "12,345 €")
+_MONEY_CHARS = frozenset('0123456789,')
+
+def _parse_money(money):
+    """Converte o volume "12,345 €" em inteiro (0 se não houver valor)
+    
+    Equivale a re.search(r'([0-9,]+)\s*€') sem passar pelo motor de regex:
+    procura, antes de cada "€", a sequência final de dígitos e vírgulas.
+    """
+    if '€' not in money:
+        return 0
+    
+    for segment in money.split('€')[:-1]:
+        segment = segment.rstrip()
+        start = len(segment)
+        while start and segment[start - 1] in _MONEY_CHARS:
+            start -= 1
+        
+        if start < len(segment):
+            digits = segment[start:].replace(',', '')
+            return int(digits) if digits else 0
+    
+    return 0
+
+# Script executado no navegador que lê todas as linhas de jogos de uma vez
+_ROWS_EXTRACT_JS = """
+(args) => {
+    const rows = Array.from(document.querySelectorAll(args.game_rows));
+    const limit = args.max_games == null ? rows.length : args.max_games;
+    const games = rows.slice(0, limit).map((row) => {
+        const cells = row.querySelectorAll(args.game_cells);
+        if (cells.length < 5) {
+            return null;
+        }
+        const img = cells[1].querySelector(args.country_img);
+        return {
+            game_id: row.getAttribute('game_id'),
+            data_game_link: row.getAttribute('data-game-link'),
+            date_time: cells[0].innerText,
+            country: img ? {
+                src: img.getAttribute('src'),
+                alt: img.getAttribute('alt'),
+                title: img.getAttribute('title')
+            } : {},
+            league: cells[2].innerText,
+            teams: cells[3].innerText,
+            money: cells[4].innerText
+        };
+    });
+    return {total: rows.length, games: games};
+}
+"""
+
+def _cell_text(node):
+    """Texto de uma célula com espaços normalizados (aproxima o innerText)"""
+    return ' '.join(node.text().split())
 
 class GameExtractor:
     """Classe responsável pela extração de dados dos jogos"""
@@ -29,7 +99,10 @@ class GameExtractor:
         self.logger = get_logger(__name__)
         self.browser = None
         self.page = None
+        self.page_pool = []
         self.games_data = []
+        self.stream_path = None
+        self.run_timestamp = None
         self.stats = {}
     
     async def setup_browser(self):
@@ -48,15 +121,33 @@ class GameExtractor:
         )
         
         self.page = await context.new_page()
+        await self._block_resources(self.page)
         self.logger.info("✅ Navegador configurado com sucesso")
     
+    async def _block_resources(self, page):
+        """Bloqueia o carregamento de recursos desnecessários para a extração"""
+        blocked_types = set(PLAYWRIGHT_CONFIG['blocked_resource_types'])
+        if EXTRACTION_CONFIG['save_screenshots']:
+            blocked_types -= {'image', 'font'}
+        
+        if not blocked_types:
+            return
+        
+        async def handle_route(route):
+            if route.request.resource_type in blocked_types:
+                await route.abort()
+            else:
+                await route.continue_()
+        
+        await page.route("**/*", handle_route)
+    
     async def navigate_to_site(self):
         """Navega para o site principal"""
         self.logger.info(MESSAGES['navigation'].format(url=BASE_URL))
         
         await self.page.goto(
             BASE_URL, 
-            wait_until=PLAYWRIGHT_CONFIG['wait_until'],
+            wait_until=PLAYWRIGHT_CONFIG['list_wait_until'],
             timeout=TIMEOUTS['page_load']
         )
         
@@ -68,57 +159,156 @@ class GameExtractor:
         
         self.logger.info("✅ Página carregada com sucesso")
     
-    async def extract_games_data(self):
-        """Extrai dados de todos os jogos"""
+    async def fetch_list_via_http(self):
+        """Busca e interpreta a lista de jogos via HTTP, sem o navegador
+        
+        Returns:
+            dict: Linhas no mesmo formato de _ROWS_EXTRACT_JS, ou None se a
+                busca falhar ou a página não trouxer jogos
+        """
+        if not HTTP_FETCH_AVAILABLE:
+            self.logger.warning("⚠️ httpx/selectolax não instalados. Execute: pip install httpx selectolax")
+            return None
+        
+        self.logger.info(MESSAGES['navigation'].format(url=BASE_URL))
+        
+        try:
+            async with httpx.AsyncClient(
+                headers={'User-Agent': PLAYWRIGHT_CONFIG['user_agent']},
+                timeout=TIMEOUTS['page_load'] / 1000,
+                follow_redirects=True
+            ) as client:
+                response = await client.get(BASE_URL)
+                response.raise_for_status()
+        except Exception as e:
+            self.logger.warning(f"⚠️ Falha na busca via HTTP: {e}")
+            return None
+        
+        page_data = self._parse_rows_html(response.text)
+        if not page_data['games']:
+            self.logger.warning("⚠️ Nenhum jogo encontrado no HTML estático")
+            return None
+        
+        return page_data
+    
+    def _parse_rows_html(self, html):
+        """Lê as linhas de jogos do HTML, com os mesmos campos do script do navegador"""
+        tree = LexborHTMLParser(html)
+        rows = tree.css(SELECTORS['game_rows'])
+        max_games = EXTRACTION_CONFIG.get('max_games_per_run')
+        
+        games = []
+        for row in rows[:max_games]:
+            cells = row.css(SELECTORS['game_cells'])
+            if len(cells) < 5:
+                games.append(None)
+                continue
+            
+            img = cells[1].css_first(SELECTORS['country_img'])
+            games.append({
+                'game_id': row.attributes.get('game_id'),
+                'data_game_link': row.attributes.get('data-game-link'),
+                'date_time': _cell_text(cells[0]),
+                'country': {
+                    'src': img.attributes.get('src'),
+                    'alt': img.attributes.get('alt'),
+                    'title': img.attributes.get('title')
+                } if img else {},
+                'league': _cell_text(cells[2]),
+                'teams': _cell_text(cells[3]),
+                'money': _cell_text(cells[4])
+            })
+        
+        return {'total': len(rows), 'games': games}
+    
+    async def read_page_rows(self):
+        """Lê todas as linhas de jogos da página numa única chamada ao navegador"""
+        return await self.page.evaluate(_ROWS_EXTRACT_JS, {
+            'game_rows': SELECTORS['game_rows'],
+            'game_cells': SELECTORS['game_cells'],
+            'country_img': SELECTORS['country_img'],
+            'max_games': EXTRACTION_CONFIG.get('max_games_per_run')
+        })
+    
+    async def extract_games_data(self, out_queue=None, page_data=None):
+        """Extrai dados de todos os jogos
+        
+        Args:
+            out_queue (asyncio.Queue): Fila opcional que recebe cada jogo válido
+                assim que é extraído
+            page_data (dict): Linhas já lidas (ex.: via HTTP); se omitido, são
+                lidas da página do navegador
+        """
         self.logger.info(MESSAGES['extraction_start'])
         
-        # Encontra todas as linhas de jogos
-        game_rows = await self.page.query_selector_all(SELECTORS['game_rows'])
-        total_games = len(game_rows)
+        max_games = EXTRACTION_CONFIG.get('max_games_per_run')
+        
+        if page_data is None:
+            page_data = await self.read_page_rows()
+        total_games = page_data['total']
+        game_rows = page_data['games']
         
         self.logger.info(f"🎯 Encontradas {total_games} linhas de jogos")
         
         # Limita o número de jogos se configurado
-        max_games = EXTRACTION_CONFIG.get('max_games_per_run', total_games)
-        if total_games > max_games:
-            game_rows = game_rows[:max_games]
+        if max_games is not None and total_games > max_games:
             self.logger.warning(f"⚠️ Limitando extração a {max_games} jogos")
         
-        # Extrai dados de cada jogo
-        for i, row in enumerate(game_rows):
-            try:
-                game_data = await self._extract_single_game(row, i)
-                if game_data and validate_game_data(game_data):
+        # Processa os dados de todos os jogos numa thread, liberando o event loop
+        loop = asyncio.get_running_loop()
+        processed = await loop.run_in_executor(None, self._finalize_rows, game_rows)
+        
+        # Opcionalmente grava cada jogo válido no JSONL à medida que é aceito
+        stream = None
+        if EXTRACTION_CONFIG['stream_games_jsonl']:
+            self.stream_path = DATA_DIR / build_filename('games_stream', self._timestamp())
+            self.stream_path.parent.mkdir(parents=True, exist_ok=True)
+            stream = open(self.stream_path, 'wb')
+        
+        try:
+            for i, (game_data, error) in enumerate(processed):
+                if error is not None:
+                    self.logger.error(f"❌ Erro ao extrair jogo {i+1}: {error}")
+                elif game_data:
                     self.games_data.append(game_data)
+                    if stream:
+                        stream.write(dump_json_line(game_data))
+                    if out_queue is not None:
+                        await out_queue.put(game_data)
                     self.logger.debug(f"✅ Jogo {i+1}/{len(game_rows)}: {game_data['teams']}")
                 else:
                     self.logger.warning(f"⚠️ Dados inválidos para jogo {i+1}")
-            except Exception as e:
-                self.logger.error(f"❌ Erro ao extrair jogo {i+1}: {e}")
+        finally:
+            if stream:
+                stream.close()
         
         self.logger.info(MESSAGES['extraction_complete'].format(count=len(self.games_data)))
     
-    async def _extract_single_game(self, row, index):
-        """Extrai dados de um único jogo"""
-        # Extrai atributos da linha
-        game_id = await row.get_attribute('game_id')
-        data_game_link = await row.get_attribute('data-game-link')
+    def _finalize_rows(self, game_rows):
+        """Monta e valida os dados de todas as linhas (executado fora do event loop)
         
-        # Extrai dados das células
-        cells = await row.query_selector_all(SELECTORS['game_cells'])
+        Returns:
+            list: Um par (game_data, erro) por linha; game_data é None se inválido
+        """
+        processed = []
+        for i, row_data in enumerate(game_rows):
+            try:
+                game_data = self._build_game_data(row_data, i)
+                if game_data and validate_game_data(game_data):
+                    processed.append((game_data, None))
+                else:
+                    processed.append((None, None))
+            except Exception as e:
+                processed.append((None, e))
         
-        if len(cells) < 5:
+        return processed
+    
+    def _build_game_data(self, row_data, index):
+        """Monta os dados de um único jogo a partir da linha lida no navegador"""
+        if not row_data:
             return None
         
-        # Extrai texto de cada célula
-        date_time = await cells[0].inner_text()
-        
-        # Extrai informações do país
-        country_info = await self._extract_country_info(cells[1])
-        
-        league = await cells[2].inner_text()
-        teams = await cells[3].inner_text()
-        money = await cells[4].inner_text()
+        data_game_link = row_data['data_game_link']
         
         # Processa o link do jogo
         game_link = self._process_game_link(data_game_link)
@@ -126,12 +316,12 @@ class GameExtractor:
         # Monta dados do jogo
         game_data = {
             'index': index + 1,
-            'game_id': game_id,
-            'date_time': date_time.strip(),
-            'country': country_info,
-            'league': league.strip(),
-            'teams': teams.strip(),
-            'money': money.strip(),
+            'game_id': row_data['game_id'],
+            'date_time': row_data['date_time'].strip(),
+            'country': row_data['country'],
+            'league': row_data['league'].strip(),
+            'teams': row_data['teams'].strip(),
+            'money': row_data['money'].strip(),
             'game_link': game_link,
             'data_game_link_raw': data_game_link,
             'extracted_at': datetime.now().isoformat()
@@ -142,17 +332,6 @@ class GameExtractor:
         
         return game_data
     
-    async def _extract_country_info(self, cell):
-        """Extrai informações do país da célula"""
-        country_img = await cell.query_selector(SELECTORS['country_img'])
-        if country_img:
-            return {
-                'src': await country_img.get_attribute('src'),
-                'alt': await country_img.get_attribute('alt'),
-                'title': await country_img.get_attribute('title')
-            }
-        return {}
-    
     def _process_game_link(self, data_game_link):
         """Processa o link do jogo"""
         if data_game_link:
@@ -172,39 +351,137 @@ class GameExtractor:
             game_data['away_team'] = team_parts[1].strip()
         
         # Extrai valor monetário numérico
-        money_match = re.search(r'([0-9,]+)\s*€', money)
-        if money_match:
-            money_value = money_match.group(1).replace(',', '')
-            try:
-                game_data['money_numeric'] = int(money_value)
-            except ValueError:
-                game_data['money_numeric'] = 0
-        else:
-            game_data['money_numeric'] = 0
+        game_data['money_numeric'] = _parse_money(money)
     
-    async def validate_sample_links(self):
-        """Valida uma amostra de links extraídos"""
-        sample_size = EXTRACTION_CONFIG['validate_links_sample']
-        self.logger.info(MESSAGES['validation_start'])
+    async def _get_page_pool(self, size):
+        """Retorna o pool de páginas para validação, criando-o na primeira chamada
         
-        valid_links = 0
-        sample_games = self.games_data[:sample_size]
+        Cada página tem seu próprio contexto, permitindo navegações em paralelo.
+        """
+        while len(self.page_pool) < size:
+            context = await self.browser.new_context(
+                viewport=PLAYWRIGHT_CONFIG['viewport'],
+                user_agent=PLAYWRIGHT_CONFIG['user_agent']
+            )
+            self.page_pool.append(await context.new_page())
         
-        for i, game in enumerate(sample_games):
-            if game.get('game_link'):
+        return self.page_pool[:size]
+    
+    async def _check_links_http(self, sample_games):
+        """Consulta o status dos links via HTTP, sem navegador
+        
+        Usa HEAD (sem baixar o corpo) e recorre ao GET quando o servidor não
+        aceita HEAD. O número de requisições simultâneas é limitado.
+        
+        Returns:
+            dict: Status HTTP por link (links com erro de acesso ficam de fora)
+        """
+        semaphore = asyncio.Semaphore(EXTRACTION_CONFIG['validation_http_concurrency'])
+        
+        async def check_link(client, i, game):
+            async with semaphore:
+                try:
+                    self.logger.debug(f"🌐 Testando link {i+1}: {game['game_link']}")
+                    response = await client.head(game['game_link'])
+                    if response.status_code in (405, 501):
+                        response = await client.get(game['game_link'])
+                    return response.status_code
+                except Exception as e:
+                    self.logger.error(f"❌ Erro ao acessar link: {e}")
+                    return None
+        
+        async with httpx.AsyncClient(
+            headers={'User-Agent': PLAYWRIGHT_CONFIG['user_agent']},
+            timeout=TIMEOUTS['page_load'] / 1000,
+            follow_redirects=True
+        ) as client:
+            results = await asyncio.gather(*[check_link(client, i, game) for i, game in sample_games])
+        
+        return {
+            game['game_link']: status
+            for (_, game), status in zip(sample_games, results)
+            if status is not None
+        }
+    
+    async def _check_links_browser(self, sample_games):
+        """Consulta o status dos links com um pool de workers, cada um com sua página
+        
+        Os links são colocados numa fila e consumidos pelos workers; cada
+        navegação termina assim que o status da resposta é conhecido.
+        
+        Returns:
+            dict: Status HTTP por link (links com erro de acesso ficam de fora)
+        """
+        links = asyncio.Queue()
+        for item in sample_games:
+            links.put_nowait(item)
+        
+        statuses = {}
+        
+        async def worker(page):
+            while not links.empty():
+                i, game = links.get_nowait()
                 try:
                     self.logger.debug(f"🌐 Testando link {i+1}: {game['game_link']}")
-                    response = await self.page.goto(
-                        game['game_link'], 
+                    response = await page.goto(
+                        game['game_link'],
+                        wait_until='commit',
                         timeout=TIMEOUTS['page_load']
                     )
-                    if response.status == 200:
-                        valid_links += 1
-                        self.logger.debug(f"✅ Link válido: {game['teams']}")
-                    else:
-                        self.logger.warning(f"⚠️ Link retornou status {response.status}: {game['teams']}")
+                    statuses[game['game_link']] = response.status
                 except Exception as e:
                     self.logger.error(f"❌ Erro ao acessar link: {e}")
+                finally:
+                    links.task_done()
+        
+        pool_size = min(EXTRACTION_CONFIG['validation_pool_size'], len(sample_games))
+        await asyncio.gather(*[worker(page) for page in await self._get_page_pool(pool_size)])
+        
+        return statuses
+    
+    async def validate_sample_links(self):
+        """Valida uma amostra de links extraídos
+        
+        Links verificados recentemente reaproveitam o status em cache; os
+        demais são consultados em paralelo via HTTP (ou pelo navegador, se
+        httpx não estiver instalado).
+        """
+        sample_size = EXTRACTION_CONFIG['validate_links_sample']
+        self.logger.info(MESSAGES['validation_start'])
+        
+        sample_games = [
+            (i, game) for i, game in enumerate(self.games_data[:sample_size])
+            if game.get('game_link')
+        ]
+        
+        statuses = load_link_statuses(CACHE_CONFIG['link_status_ttl'])
+        pending = [(i, game) for i, game in sample_games if game['game_link'] not in statuses]
+        
+        if pending:
+            # HTTP é bem mais leve que navegar; o navegador fica como alternativa
+            if HTTPX_AVAILABLE:
+                checked = await self._check_links_http(pending)
+            else:
+                if not self.browser:
+                    await self.setup_browser()
+                checked = await self._check_links_browser(pending)
+            
+            save_link_statuses(checked)
+            statuses.update(checked)
+        
+        valid_links = 0
+        for _, game in sample_games:
+            status = statuses.get(game['game_link'])
+            
+            # Registra o resultado no próprio jogo para uso posterior
+            game['link_status'] = status
+            game['link_valid'] = status == 200
+            
+            if status == 200:
+                valid_links += 1
+                self.logger.debug(f"✅ Link válido: {game['teams']}")
+            elif status is not None:
+                self.logger.warning(f"⚠️ Link retornou status {status}: {game['teams']}")
         
         self.logger.info(f"📊 Links válidos: {valid_links}/{sample_size}")
         return valid_links
@@ -214,47 +491,78 @@ class GameExtractor:
         if not self.games_data:
             return {}
         
+        # Acumula todas as contagens numa única passagem pelos jogos
+        games_with_links = 0
+        games_with_money = 0
+        total_money = 0
+        leagues = set()
+        countries = set()
+        
+        for game in self.games_data:
+            if game.get('game_link'):
+                games_with_links += 1
+            
+            money_value = game.get('money_numeric', 0)
+            if money_value > 0:
+                games_with_money += 1
+            total_money += money_value
+            
+            league = game.get('league')
+            if league:
+                leagues.add(league)
+            
+            country = game.get('country', {}).get('alt')
+            if country:
+                countries.add(country)
+        
         self.stats = {
             'total_games': len(self.games_data),
-            'games_with_links': sum(1 for game in self.games_data if game.get('game_link')),
-            'games_with_money': sum(1 for game in self.games_data if game.get('money_numeric', 0) > 0),
-            'total_money': sum(game.get('money_numeric', 0) for game in self.games_data),
-            'leagues': list(set(game['league'] for game in self.games_data if game.get('league'))),
-            'countries': list(set(
-                game['country'].get('alt', '') 
-                for game in self.games_data 
-                if game.get('country', {}).get('alt')
-            )),
+            'games_with_links': games_with_links,
+            'games_with_money': games_with_money,
+            'total_money': total_money,
+            'leagues': sorted(leagues),
+            'countries': sorted(countries),
             'date_range': {
-                'first': self.games_data[0]['date_time'] if self.games_data else None,
-                'last': self.games_data[-1]['date_time'] if self.games_data else None
+                'first': self.games_data[0]['date_time'],
+                'last': self.games_data[-1]['date_time']
             },
             'extraction_timestamp': datetime.now().isoformat()
         }
         
         return self.stats
     
+    def _timestamp(self):
+        """Timestamp da execução, compartilhado por todos os arquivos gerados"""
+        if self.run_timestamp is None:
+            self.run_timestamp = format_timestamp()
+        return self.run_timestamp
+    
     async def save_screenshots(self):
         """Salva screenshots da página"""
-        if not EXTRACTION_CONFIG['save_screenshots']:
+        if not EXTRACTION_CONFIG['save_screenshots'] or not self.page:
             return
         
-        timestamp = format_timestamp()
+        timestamp = self._timestamp()
+        
+        full_path = SCREENSHOTS_DIR / build_filename('screenshot_full', timestamp)
+        viewport_path = SCREENSHOTS_DIR / build_filename('screenshot_viewport', timestamp)
         
         try:
-            # Screenshot da página completa
-            full_path = SCREENSHOTS_DIR / FILE_PATTERNS['screenshot_full'].format(timestamp=timestamp)
-            await self.page.screenshot(
-                path=str(full_path), 
-                full_page=True,
-                timeout=TIMEOUTS['screenshot']
-            )
-            
-            # Screenshot do viewport
-            viewport_path = SCREENSHOTS_DIR / FILE_PATTERNS['screenshot_viewport'].format(timestamp=timestamp)
-            await self.page.screenshot(
-                path=str(viewport_path),
-                timeout=TIMEOUTS['screenshot']
+            # Screenshots da página completa e do viewport em paralelo (JPEG)
+            await asyncio.gather(
+                self.page.screenshot(
+                    path=str(full_path),
+                    full_page=True,
+                    type='jpeg',
+                    quality=EXTRACTION_CONFIG['screenshot_quality'],
+                    timeout=TIMEOUTS['screenshot']
+                ),
+                self.page.screenshot(
+                    path=str(viewport_path),
+                    type='jpeg',
+                    quality=EXTRACTION_CONFIG['screenshot_quality'],
+                    timeout=TIMEOUTS['screenshot']
+                )
             )
             
             self.logger.info(f"📸 Screenshots salvos: {full_path.name}, {viewport_path.name}")
@@ -262,32 +570,41 @@ class GameExtractor:
             self.logger.error(f"❌ Erro ao salvar screenshots: {e}")
     
     async def save_results(self):
-        """Salva os resultados em arquivo JSON"""
-        timestamp = format_timestamp()
-        filename = FILE_PATTERNS['games_data'].format(timestamp=timestamp)
+        """Salva os resultados em arquivo JSON
+        
+        Com EXTRACTION_CONFIG['stream_games_jsonl'], os jogos já estão no
+        arquivo JSONL gravado durante a extração; aqui só é gravado o arquivo
+        .meta.json com metadados e estatísticas, e o caminho do JSONL é retornado.
+        """
+        filename = build_filename('games_data', self._timestamp())
         filepath = DATA_DIR / filename
         
+        metadata = {
+            'extraction_timestamp': datetime.now().isoformat(),
+            'base_url': BASE_URL,
+            'total_games_extracted': len(self.games_data),
+            'extractor_version': '2.0',
+            'config_used': {
+                'max_games': EXTRACTION_CONFIG.get('max_games_per_run'),
+                'validate_sample': EXTRACTION_CONFIG['validate_links_sample']
+            }
+        }
+        
+        if self.stream_path:
+            metadata['games_file'] = self.stream_path.name
+            meta_path = DATA_DIR / build_filename('games_metadata', self._timestamp())
+            save_json_file({'metadata': metadata, 'statistics': self.stats}, meta_path)
+            
+            self.logger.info(MESSAGES['save_data'].format(filename=self.stream_path.name))
+            return str(self.stream_path)
+        
         results = {
-            'metadata': {
-                'extraction_timestamp': datetime.now().isoformat(),
-                'base_url': BASE_URL,
-                'total_games_extracted': len(self.games_data),
-                'extractor_version': '2.0',
-                'config_used': {
-                    'max_games': EXTRACTION_CONFIG.get('max_games_per_run'),
-                    'validate_sample': EXTRACTION_CONFIG['validate_links_sample']
-                }
-            },
+            'metadata': metadata,
             'statistics': self.stats,
             'games': self.games_data
         }
         
-        with open(filepath, 'w', encoding=FILE_CONFIG['encoding']) as f:
-            json.dump(
-                results, f, 
-                indent=FILE_CONFIG['json_indent'],
-                ensure_ascii=FILE_CONFIG['ensure_ascii']
-            )
+        save_json_file(results, filepath)
         
         self.logger.info(MESSAGES['save_data'].format(filename=filename))
         return str(filepath)
@@ -316,11 +633,21 @@ class GameExtractor:
                 print(f"      🔗 Link: {game['game_link']}")
                 print(f"      💰 Valor: {game['money']}")
     
-    async def cleanup(self):
-        """Limpa recursos do navegador"""
+    async def cleanup(self, shutdown_shared_browser=True):
+        """Limpa recursos do navegador
+        
+        Args:
+            shutdown_shared_browser (bool): Se também fecha o navegador
+                compartilhado (mantido aberto quando outros consumidores, como
+                os workers do pipeline, ainda o usam)
+        """
         if self.browser:
             await self.browser.close()
             self.logger.info(MESSAGES['cleanup'])
+        
+        # Fecha o navegador compartilhado usado pela análise individual
+        if shutdown_shared_browser:
+            await shutdown_pool()
     
     async def analyze_individual_games(self):
         """Analisa cada jogo individualmente usando o GameAnalyzer"""
@@ -358,31 +685,56 @@ class GameExtractor:
         finally:
             await analyzer.cleanup()
     
-    async def run_extraction(self, analyze_individual_games=False):
+    async def run_extraction(self, analyze_individual_games=False, out_queue=None):
         """Executa o processo completo de extração
         
         Args:
             analyze_individual_games (bool): Se deve analisar cada jogo individualmente
+            out_queue (asyncio.Queue): Fila opcional que recebe cada jogo extraído;
+                ao final recebe o sentinela None
         """
         self.logger.info(MESSAGES['start'])
+        self.run_timestamp = format_timestamp()
         
         try:
-            await self.setup_browser()
-            await self.navigate_to_site()
-            await self.extract_games_data()
+            # Reaproveita a lista em cache; senão tenta HTTP e, por fim, o navegador
+            page_data = get_cached(BASE_URL, CACHE_CONFIG['list_page_ttl'])
             
-            if self.games_data:
-                await self.validate_sample_links()
-                self.generate_statistics()
+            if page_data:
+                self.logger.info("♻️ Lista de jogos reaproveitada do cache")
+            else:
+                if EXTRACTION_CONFIG['http_list_fetch']:
+                    page_data = await self.fetch_list_via_http()
                 
-                # Análise individual de jogos se solicitada
-                if analyze_individual_games:
-                    await self.analyze_individual_games()
+                if page_data:
+                    self.logger.info("⚡ Lista de jogos obtida via HTTP, sem abrir o navegador")
+                else:
+                    await self.setup_browser()
+                    await self.navigate_to_site()
+                    page_data = await self.read_page_rows()
                 
-                if EXTRACTION_CONFIG['save_screenshots']:
-                    await self.save_screenshots()
+                if page_data['games']:
+                    set_cached(BASE_URL, page_data)
+            
+            await self.extract_games_data(out_queue, page_data)
+            
+            if self.games_data:
+                # Screenshots começam com a página pronta e rodam em paralelo
+                # à validação, à análise individual e à gravação dos resultados
+                screenshot_task = asyncio.ensure_future(self.save_screenshots())
+                
+                try:
+                    await self.validate_sample_links()
+                    self.generate_statistics()
+                    
+                    # Análise individual de jogos se solicitada
+                    if analyze_individual_games:
+                        await self.analyze_individual_games()
+                    
+                    filepath = await self.save_results()
+                finally:
+                    await screenshot_task
                 
-                filepath = await self.save_results()
                 self.print_summary()
                 
                 self.logger.info(f"✅ Extração concluída: {filepath}")
@@ -396,7 +748,10 @@ class GameExtractor:
             raise
         
         finally:
-            await self.cleanup()
+            if out_queue is not None:
+                await out_queue.put(None)
+            # Com fila, os consumidores podem estar usando o navegador compartilhado
+            await self.cleanup(shutdown_shared_browser=out_queue is None)
 
 # Função de conveniência para uso direto
 async def extract_games():
@@ -6,20 +6,181 @@ Analisa cada jogo individualmente extraindo dados detalhados das páginas espec
 """
 
 import asyncio
-import json
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urljoin, urlparse, parse_qs
-from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from config.settings import (
     BASE_URL, PLAYWRIGHT_CONFIG, TIMEOUTS, SELECTORS,
     EXTRACTION_CONFIG, FILE_CONFIG, FILE_PATTERNS,
-    DATA_CONFIG, MESSAGES, DATA_DIR
+    DATA_CONFIG, MESSAGES, DATA_DIR, CACHE_CONFIG
 )
 from utils.logger import get_logger
-from utils.helpers import format_timestamp
+from utils.helpers import format_timestamp, save_json_file, save_json_stream
+from utils.cache import http_cache_key, load_http_response, save_http_response
+from modules._browser_pool import get_browser, shutdown_pool
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Padrão de valores monetários e odds (ex.: "281€ - 2.44")
+_MONEY_RE = re.compile(r'(\d+)€\s*-\s*([\d.]+)')
+
+# Parâmetro "id" da URL do jogo (ex.: ".../game?id=12345")
+_ID_RE = re.compile(r'[?&]id=([^&#]+)')
+
+# Padrão de horários do histórico de movimentação (ex.: "15:18 09.09")
+_TIME_RE = re.compile(r'(\d{1,2}:\d{2}\s+\d{1,2}\.\d{2})')
+
+# Script que serializa todas as tabelas da página numa única chamada,
+# usando os mesmos seletores da extração célula a célula
+_TABLES_EXTRACT_JS = """
+() => {
+    const texts = (row, selector) => Array.from(row.querySelectorAll(selector), cell => cell.textContent || '');
+    return Array.from(document.querySelectorAll('table'), table => {
+        const headerRow = table.querySelector('thead tr, tr:first-child');
+        return {
+            headers: headerRow ? texts(headerRow, 'th, td') : [],
+            rows: Array.from(table.querySelectorAll('tr'), row => ({
+                cells: texts(row, 'td, th'),
+                is_data: row.matches('tbody tr, tr:not(:first-child)')
+            }))
+        };
+    });
+}
+"""
+
+# Seletores do cabeçalho do jogo; os de título preenchem 'title'
+_HEADER_SELECTORS = [
+    'h1', 'h2', '.game-title', '.match-title',
+    '.teams', '.game-info', '.match-info'
+]
+_TITLE_SELECTORS = frozenset(['h1', 'h2', '.game-title', '.match-title'])
+
+# Chaves das listas de No/Yes em betting_tables, ao lado das tabelas 'table_N'
+_NO_KEY = 'no_bets'
+_YES_KEY = 'yes_bets'
+_NO_YES_KEYS = frozenset([_NO_KEY, _YES_KEY])
+
+# Nível de atividade de apostas pelo total de linhas das tabelas (acima do limite)
+_ACTIVITY_THRESHOLDS = ((20, 'high'), (10, 'medium'), (-1, 'low'))
+
+# Linhas de dados da tabela, como em _TABLES_EXTRACT_JS
+_DATA_ROW_SELECTOR = 'tbody tr, tr:not(:first-child)'
+
+def _update_header_info(header_info, selector, text):
+    """Registra o texto de um elemento do cabeçalho conforme o seletor que o encontrou"""
+    if text and text.strip():
+        if selector in _TITLE_SELECTORS:
+            header_info['title'] = text.strip()
+        elif 'team' in selector.lower():
+            header_info['teams_header'] = text.strip()
+
+def _header_info_from_tree(tree):
+    """Versão do _extract_header_info para o HTML já interpretado"""
+    header_info = {}
+    for selector in _HEADER_SELECTORS:
+        for node in tree.css(selector):
+            _update_header_info(header_info, selector, node.text())
+    return header_info
+
+def _tables_from_tree(tree):
+    """Versão do _TABLES_EXTRACT_JS para o HTML já interpretado"""
+    tables = []
+    for table in tree.css('table'):
+        header_row = table.css_first('thead tr, tr:first-child')
+        tables.append({
+            'headers': [cell.text() for cell in header_row.css('th, td')] if header_row else [],
+            'rows': [
+                {
+                    'cells': [cell.text() for cell in row.css('td, th')],
+                    'is_data': row.css_matches(_DATA_ROW_SELECTOR)
+                }
+                for row in table.css('tr')
+            ]
+        })
+    return tables
+
+def _page_stats_from_tree(tree):
+    """Versão do _read_page_stats para o HTML já interpretado"""
+    meta_info = {}
+    for meta in tree.css('meta'):
+        name = meta.attributes.get('name')
+        content = meta.attributes.get('content')
+        if name and content:
+            meta_info[name] = content
+    return {
+        'total_tables': len(tree.css('table')),
+        'total_links': len(tree.css('a')),
+        'meta_info': meta_info
+    }
+
+_BLOCKED_RESOURCE_TYPES = frozenset(PLAYWRIGHT_CONFIG['analysis_blocked_resource_types'])
+_BLOCKED_HOSTS = tuple(PLAYWRIGHT_CONFIG['blocked_hosts'])
+
+async def _block_unneeded_resources(route):
+    """Bloqueia imagens, fontes, mídia, CSS e rastreadores nas páginas de jogos"""
+    request = route.request
+    if (request.resource_type in _BLOCKED_RESOURCE_TYPES
+            or any(host in request.url for host in _BLOCKED_HOSTS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+_HTTP_CACHE_MODE = CACHE_CONFIG['http_cache_mode']
+
+async def _route_with_http_cache(route):
+    """Bloqueia recursos como _block_unneeded_resources e grava/reproduz as respostas
+    conforme CACHE_CONFIG['http_cache_mode']"""
+    request = route.request
+    if (request.resource_type in _BLOCKED_RESOURCE_TYPES
+            or any(host in request.url for host in _BLOCKED_HOSTS)):
+        await route.abort()
+        return
+    
+    key = http_cache_key(request.method, request.url, request.post_data_buffer)
+    # Leitura e gravação do cache em disco fora do event loop compartilhado
+    loop = asyncio.get_running_loop()
+    
+    if _HTTP_CACHE_MODE in ('replay', 'auto'):
+        ttl = CACHE_CONFIG['http_cache_ttl'] if _HTTP_CACHE_MODE == 'auto' else None
+        cached = await loop.run_in_executor(None, load_http_response, key, ttl)
+        if cached:
+            await route.fulfill(status=cached['status'], headers=cached['headers'], body=cached['body'])
+            return
+        
+        if _HTTP_CACHE_MODE == 'replay':
+            await route.continue_()
+            return
+    
+    # Busca a resposta real e grava apenas as bem-sucedidas
+    try:
+        response = await route.fetch()
+        body = await response.body()
+    except Exception:
+        # Sem a resposta, deixa o navegador seguir com a requisição normalmente
+        await route.continue_()
+        return
+    
+    if response.ok:
+        try:
+            await loop.run_in_executor(
+                None, save_http_response, key, response.status, response.headers, body
+            )
+        except OSError:
+            pass  # Falha ao gravar o cache não deve impedir a resposta
+    await route.fulfill(response=response, body=body)
 
 class GameAnalyzer:
     """Classe responsável pela análise detalhada de jogos individuais"""
@@ -27,7 +188,9 @@ class GameAnalyzer:
     def __init__(self):
         self.logger = get_logger(__name__)
         self.browser = None
+        self.contexts = []
         self.page = None
+        self.http_client = None
         self.analyzed_games = []
         self.stats = {
             'total_analyzed': 0,
@@ -41,60 +204,66 @@ class GameAnalyzer:
         """Configura o navegador Playwright"""
         self.logger.info("🔧 Configurando navegador para análise individual...")
         
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(
-            headless=PLAYWRIGHT_CONFIG['headless'],
-            args=PLAYWRIGHT_CONFIG['args']
-        )
+        # O navegador é compartilhado entre análises; cada analisador só cria contextos
+        self.browser = await get_browser()
         
-        context = await self.browser.new_context(
-            viewport=PLAYWRIGHT_CONFIG['viewport'],
-            user_agent=PLAYWRIGHT_CONFIG['user_agent']
-        )
+        # Os workers abrem páginas nestes contextos; um único contexto
+        # reaproveita o cache HTTP entre jogos
+        for _ in range(max(1, EXTRACTION_CONFIG['individual_analysis_contexts'])):
+            context = await self.browser.new_context(
+                viewport=PLAYWRIGHT_CONFIG['viewport'],
+                user_agent=PLAYWRIGHT_CONFIG['user_agent']
+            )
+            await context.route(
+                "**/*",
+                _block_unneeded_resources if _HTTP_CACHE_MODE == 'off' else _route_with_http_cache
+            )
+            self.contexts.append(context)
         
-        self.page = await context.new_page()
+        self.page = await self.contexts[0].new_page()
         self.logger.info("✅ Navegador configurado para análise individual")
     
-    async def analyze_game_from_url(self, game_url, game_info=None):
+    async def analyze_game_from_url(self, game_url, game_info=None, page=None):
         """Analisa um jogo específico a partir de sua URL
         
         Args:
             game_url (str): URL do jogo para análise
             game_info (dict): Informações básicas do jogo (opcional)
+            page: Página do Playwright a usar (padrão: página principal)
             
         Returns:
             dict: Dados detalhados do jogo analisado
         """
+        page = page or self.page
         self.logger.info(f"🎯 Analisando jogo: {game_url}")
         
         try:
-            # Navega para a página do jogo
-            await self.page.goto(
-                game_url,
-                wait_until=PLAYWRIGHT_CONFIG['wait_until'],
-                timeout=TIMEOUTS['page_load']
-            )
+            # Páginas estáticas são lidas via HTTP, sem renderizar no navegador
+            snapshot = None
+            if EXTRACTION_CONFIG.get('http_game_fetch'):
+                snapshot = await self._try_httpx(game_url)
             
-            # Aguarda o carregamento da página
-            await self.page.wait_for_timeout(2000)
+            if snapshot is None:
+                snapshot = await self._load_page_snapshot(page, game_url)
+            
+            # Um único horário marca todos os dados extraídos deste jogo
+            now_iso = datetime.now().isoformat()
             
             # Extrai informações básicas do jogo
-            game_data = await self._extract_game_basic_info(game_url, game_info)
+            game_data = self._extract_game_basic_info(game_url, game_info, snapshot, now_iso)
             
-            # Extrai dados das tabelas de apostas
-            betting_tables = await self._extract_betting_tables()
+            # Extrai dados das tabelas de apostas e o histórico de movimentação,
+            # percorrendo as linhas das tabelas uma única vez
+            betting_tables, movement_history = self._extract_betting_tables(snapshot, now_iso)
             game_data['betting_tables'] = betting_tables
-            
-            # Extrai histórico de movimentação
-            movement_history = await self._extract_movement_history()
             game_data['movement_history'] = movement_history
             
             # Extrai estatísticas adicionais
-            additional_stats = await self._extract_additional_stats()
+            additional_stats = self._extract_additional_stats(snapshot, now_iso)
             game_data['additional_stats'] = additional_stats
             
             # Calcula métricas de análise
-            game_data['analysis_metrics'] = self._calculate_analysis_metrics(game_data)
+            game_data['analysis_metrics'] = self._calculate_analysis_metrics(game_data, now_iso)
             
             self.stats['successful_extractions'] += 1
             self.stats['data_points_extracted'] += len(game_data.get('betting_tables', {}))
@@ -107,11 +276,118 @@ class GameAnalyzer:
             self.stats['failed_extractions'] += 1
             return None
     
-    async def _extract_game_basic_info(self, game_url, game_info=None):
+    async def _try_httpx(self, game_url):
+        """Tenta ler a página do jogo via HTTP, sem o navegador
+        
+        Args:
+            game_url (str): URL do jogo
+            
+        Returns:
+            dict: Retrato da página no formato de _read_page_snapshot, ou None
+                se a busca falhar ou o HTML não trouxer as tabelas
+        """
+        if not (HTTPX_AVAILABLE and SELECTOLAX_AVAILABLE):
+            return None
+        
+        if self.http_client is None:
+            # Um cliente por analisador, reaproveitando conexões entre jogos
+            concurrency = EXTRACTION_CONFIG['individual_analysis_concurrency']
+            self.http_client = httpx.AsyncClient(
+                headers={'User-Agent': PLAYWRIGHT_CONFIG['user_agent']},
+                timeout=TIMEOUTS['page_load'] / 1000,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+            )
+        
+        try:
+            response = await self.http_client.get(game_url)
+        except Exception as e:
+            self.logger.debug(f"Falha na busca via HTTP de {game_url}: {e}")
+            return None
+        
+        if response.status_code != 200:
+            self.logger.debug(f"Busca via HTTP de {game_url} retornou {response.status_code}")
+            return None
+        
+        # Sem as tabelas no HTML estático, a página depende de JavaScript
+        tree = LexborHTMLParser(response.text)
+        if tree.css_first(SELECTORS['ready']) is None:
+            self.logger.debug(f"HTML estático de {game_url} sem '{SELECTORS['ready']}', usando o navegador")
+            return None
+        
+        return self._parse_page_tree(tree)
+    
+    async def _load_page_snapshot(self, page, game_url):
+        """Abre a página do jogo no navegador e lê o seu retrato"""
+        # Navega para a página do jogo sem esperar o documento inteiro
+        await page.goto(
+            game_url,
+            wait_until=PLAYWRIGHT_CONFIG['analysis_wait_until'],
+            timeout=TIMEOUTS['page_load']
+        )
+        
+        # Aguarda as tabelas, que costumam surgir bem antes do fim do
+        # carregamento; se não aparecerem, espera o carregamento completo
+        try:
+            await page.wait_for_selector(
+                SELECTORS['ready'],
+                state='attached',
+                timeout=TIMEOUTS['element_wait']
+            )
+        except PlaywrightTimeoutError:
+            self.logger.debug(f"Seletor '{SELECTORS['ready']}' não encontrado, aguardando carregamento")
+            await page.wait_for_load_state('load', timeout=TIMEOUTS['page_load'])
+        
+        # Lê o conteúdo da página uma única vez; os extratores trabalham
+        # sobre esse retrato sem novas chamadas ao navegador
+        return await self._read_page_snapshot(page)
+    
+    async def _read_page_snapshot(self, page):
+        """Lê título, cabeçalho, tabelas e estatísticas da página carregada
+        
+        Com o selectolax instalado, o HTML é obtido uma vez e interpretado
+        localmente; sem ele, cada parte é lida com uma chamada ao navegador.
+        
+        Args:
+            page: Página do Playwright já carregada
+            
+        Returns:
+            dict: Retrato da página com 'title', 'header_info', 'tables' e
+                'page_stats'
+        """
+        if SELECTOLAX_AVAILABLE:
+            return self._parse_page_tree(LexborHTMLParser(await page.content()))
+        
+        try:
+            title = await page.title()
+        except Exception as e:
+            self.logger.warning(f"⚠️ Erro ao extrair título da página: {e}")
+            title = None
+        
+        return {
+            'title': title,
+            'header_info': await self._extract_header_info(page),
+            'tables': await self._extract_tables(page),
+            'page_stats': await self._read_page_stats(page)
+        }
+    
+    def _parse_page_tree(self, tree):
+        """Lê o HTML interpretado pelo selectolax, no mesmo formato de _read_page_snapshot"""
+        title_node = tree.css_first('title')
+        
+        return {
+            # Mesma normalização de espaços feita por document.title
+            'title': ' '.join(title_node.text().split()) if title_node else '',
+            'header_info': _header_info_from_tree(tree),
+            'tables': _tables_from_tree(tree),
+            'page_stats': _page_stats_from_tree(tree)
+        }
+    
+    def _extract_game_basic_info(self, game_url, game_info, snapshot, now_iso):
         """Extrai informações básicas do jogo"""
         game_data = {
             'url': game_url,
-            'extraction_timestamp': datetime.now().isoformat(),
+            'extraction_timestamp': now_iso,
             'game_id': self._extract_game_id_from_url(game_url)
         }
         
@@ -119,101 +395,147 @@ class GameAnalyzer:
         if game_info:
             game_data.update(game_info)
         
-        try:
-            # Tenta extrair título da página
-            title = await self.page.title()
-            if title:
-                game_data['page_title'] = title
-                # Extrai times do título se não temos essa informação
-                if 'teams' not in game_data and ' - ' in title:
-                    game_data['teams'] = title.split(' - ')[0] + ' - ' + title.split(' - ')[1]
-            
-            # Extrai informações do cabeçalho do jogo
-            header_info = await self._extract_header_info()
-            if header_info:
-                game_data.update(header_info)
-                
-        except Exception as e:
-            self.logger.warning(f"⚠️ Erro ao extrair informações básicas: {e}")
+        # Título da página
+        title = snapshot['title']
+        if title:
+            game_data['page_title'] = title
+            # Extrai times do título se não temos essa informação
+            if 'teams' not in game_data and ' - ' in title:
+                game_data['teams'] = title.split(' - ')[0] + ' - ' + title.split(' - ')[1]
+        
+        # Informações do cabeçalho do jogo
+        if snapshot['header_info']:
+            game_data.update(snapshot['header_info'])
         
         return game_data
     
-    async def _extract_header_info(self):
+    async def _extract_header_info(self, page):
         """Extrai informações do cabeçalho da página do jogo"""
         header_info = {}
         
         try:
-            # Possíveis seletores para informações do cabeçalho
-            header_selectors = [
-                'h1', 'h2', '.game-title', '.match-title',
-                '.teams', '.game-info', '.match-info'
-            ]
-            
-            for selector in header_selectors:
-                elements = await self.page.query_selector_all(selector)
+            for selector in _HEADER_SELECTORS:
+                elements = await page.query_selector_all(selector)
                 for element in elements:
                     text = await element.text_content()
-                    if text and text.strip():
-                        if selector in ['h1', 'h2', '.game-title', '.match-title']:
-                            header_info['title'] = text.strip()
-                        elif 'team' in selector.lower():
-                            header_info['teams_header'] = text.strip()
+                    _update_header_info(header_info, selector, text)
                         
         except Exception as e:
             self.logger.debug(f"Erro ao extrair header: {e}")
         
         return header_info
     
-    async def _extract_betting_tables(self):
-        """Extrai dados das tabelas de apostas disponíveis"""
+    async def _extract_tables(self, page):
+        """Lê cabeçalhos e linhas de todas as tabelas da página numa única chamada
+        
+        Args:
+            page: Página do Playwright já carregada
+            
+        Returns:
+            list: Uma entrada por tabela com 'headers' e 'rows' (cada linha com
+                'cells' e 'is_data', que indica se é linha de dados)
+        """
+        try:
+            return await page.evaluate(_TABLES_EXTRACT_JS)
+        except Exception as e:
+            self.logger.debug(f"Erro ao ler tabelas da página: {e}")
+            return []
+    
+    async def _read_page_stats(self, page):
+        """Conta tabelas e links e lê as meta informações da página"""
+        page_stats = {}
+        
+        try:
+            page_stats['total_tables'] = len(await page.query_selector_all('table'))
+            page_stats['total_links'] = len(await page.query_selector_all('a'))
+            
+            meta_info = {}
+            for meta in await page.query_selector_all('meta'):
+                name = await meta.get_attribute('name')
+                content = await meta.get_attribute('content')
+                if name and content:
+                    meta_info[name] = content
+            page_stats['meta_info'] = meta_info
+            
+        except Exception as e:
+            self.logger.debug(f"Erro ao ler estatísticas da página: {e}")
+        
+        return page_stats
+    
+    def _extract_betting_tables(self, snapshot, now_iso):
+        """Extrai dados das tabelas de apostas disponíveis
+        
+        Returns:
+            tuple: (tabelas de apostas, histórico de movimentação encontrado
+                nas mesmas linhas)
+        """
         betting_tables = {}
+        movement_data = []
         
         try:
-            # Procura por tabelas na página
-            tables = await self.page.query_selector_all('table')
+            tables = snapshot['tables']
             self.logger.info(f"📊 Encontradas {len(tables)} tabelas na página")
             
             for i, table in enumerate(tables):
-                table_data = await self._extract_table_data(table, f"table_{i+1}")
+                table_data = self._extract_table_data(table, f"table_{i+1}", movement_data, now_iso)
                 if table_data:
                     betting_tables[f"table_{i+1}"] = table_data
                     self.stats['tables_found'] += 1
             
             # Procura especificamente pelas tabelas de "No" e "Yes"
-            no_yes_tables = await self._extract_no_yes_tables()
+            no_yes_tables = self._extract_no_yes_tables(tables)
             if no_yes_tables:
                 betting_tables.update(no_yes_tables)
                 
         except Exception as e:
             self.logger.error(f"❌ Erro ao extrair tabelas de apostas: {e}")
         
-        return betting_tables
+        return betting_tables, movement_data
     
-    async def _extract_table_data(self, table, table_name):
-        """Extrai dados de uma tabela específica"""
+    def _extract_table_data(self, table, table_name, movement_data, now_iso):
+        """Extrai dados de uma tabela específica já serializada
+        
+        Args:
+            table (dict): Tabela no formato de _extract_tables
+            table_name (str): Nome da tabela no resultado
+            movement_data (list): Recebe as linhas com dados temporais
+            now_iso (str): Horário da extração, gravado em cada linha do histórico
+            
+        Returns:
+            dict: Dados da tabela, ou None se ela estiver vazia
+        """
         try:
             # Extrai cabeçalhos
-            headers = []
-            header_rows = await table.query_selector_all('thead tr, tr:first-child')
-            if header_rows:
-                header_cells = await header_rows[0].query_selector_all('th, td')
-                for cell in header_cells:
-                    text = await cell.text_content()
-                    headers.append(text.strip() if text else '')
+            headers = [text.strip() for text in table['headers']]
             
             # Extrai dados das linhas
             rows_data = []
-            data_rows = await table.query_selector_all('tbody tr, tr:not(:first-child)')
-            
-            for row in data_rows:
-                cells = await row.query_selector_all('td, th')
-                row_data = []
-                for cell in cells:
-                    text = await cell.text_content()
-                    row_data.append(text.strip() if text else '')
+            
+            # Referências locais para o laço, que roda uma vez por linha
+            time_search = _TIME_RE.search
+            add_movement = movement_data.append
+            add_row = rows_data.append
+            
+            for row in table['rows']:
+                cells = row['cells']
+                
+                # Histórico de movimentação: linhas com horários como "15:18 09.09"
+                row_text = [text.strip() for text in cells if text]
+                full_row_text = ' '.join(row_text)
+                if time_search(full_row_text):
+                    add_movement({
+                        'timestamp_extracted': now_iso,
+                        'row_data': row_text,
+                        'full_text': full_row_text
+                    })
+                
+                if not row['is_data']:
+                    continue
+                
+                row_data = [text.strip() for text in cells]
                 
                 if row_data and any(cell for cell in row_data):  # Só adiciona se não estiver vazia
-                    rows_data.append(row_data)
+                    add_row(row_data)
             
             if headers or rows_data:
                 return {
@@ -229,129 +551,77 @@ class GameAnalyzer:
         
         return None
     
-    async def _extract_no_yes_tables(self):
+    def _extract_no_yes_tables(self, tables):
         """Extrai especificamente as tabelas de 'No' e 'Yes' como no exemplo fornecido"""
         no_yes_data = {}
         
         try:
-            # Procura por elementos que contenham "No" e "Yes" com valores monetários
+            # Células das tabelas com valores monetários e odds
             # Baseado no exemplo: "281€ - 2.44" para No e "82€ - 1.69" para Yes
-            
-            # Padrão para encontrar valores monetários e odds
-            money_pattern = r'(\d+)€\s*-\s*([\d.]+)'
-            
-            # Procura por todos os elementos de texto na página
-            all_elements = await self.page.query_selector_all('*')
-            
             no_data = []
             yes_data = []
             
-            for element in all_elements:
-                text = await element.text_content()
-                if text and text.strip():
-                    text = text.strip()
+            # Referência local para o laço, que roda uma vez por célula
+            money_search = _MONEY_RE.search
+            
+            for table in tables:
+                for row in table['rows']:
+                    # O contexto de cada célula é o texto da linha inteira
+                    row_text = None
                     
-                    # Verifica se contém padrão de dinheiro e odds
-                    money_match = re.search(money_pattern, text)
-                    if money_match:
-                        money_value = money_match.group(1)
-                        odds_value = money_match.group(2)
+                    for cell in row['cells']:
+                        money_match = money_search(cell)
+                        if not money_match:
+                            continue
                         
-                        # Determina se é "No" ou "Yes" baseado no contexto
-                        parent_text = await element.evaluate('el => el.parentElement ? el.parentElement.textContent : ""')
+                        text = cell.strip()
+                        lower_text = text.lower()
+                        if row_text is None:
+                            row_text = ' '.join(row['cells']).lower()
+                        
+                        bet = {
+                            'money': f"{money_match.group(1)}€",
+                            'odds': money_match.group(2),
+                            'full_text': text
+                        }
                         
-                        if 'no' in text.lower() or 'no' in parent_text.lower():
-                            no_data.append({
-                                'money': f"{money_value}€",
-                                'odds': odds_value,
-                                'full_text': text
-                            })
-                        elif 'yes' in text.lower() or 'yes' in parent_text.lower():
-                            yes_data.append({
-                                'money': f"{money_value}€",
-                                'odds': odds_value,
-                                'full_text': text
-                            })
+                        # Determina se é "No" ou "Yes" baseado no contexto
+                        if 'no' in lower_text or 'no' in row_text:
+                            no_data.append(bet)
+                        elif 'yes' in lower_text or 'yes' in row_text:
+                            yes_data.append(bet)
             
             if no_data:
-                no_yes_data['no_bets'] = no_data
+                no_yes_data[_NO_KEY] = no_data
             if yes_data:
-                no_yes_data['yes_bets'] = yes_data
+                no_yes_data[_YES_KEY] = yes_data
                 
         except Exception as e:
             self.logger.debug(f"Erro ao extrair tabelas No/Yes: {e}")
         
         return no_yes_data
     
-    async def _extract_movement_history(self):
-        """Extrai histórico de movimentação das apostas"""
-        movement_data = []
-        
-        try:
-            # Procura por tabelas que contenham dados temporais
-            # Baseado no exemplo que mostra horários como "15:18 09.09"
-            time_pattern = r'(\d{1,2}:\d{2}\s+\d{1,2}\.\d{2})'
-            
-            tables = await self.page.query_selector_all('table')
-            
-            for table in tables:
-                rows = await table.query_selector_all('tr')
-                
-                for row in rows:
-                    cells = await row.query_selector_all('td, th')
-                    row_text = []
-                    
-                    for cell in cells:
-                        text = await cell.text_content()
-                        if text:
-                            row_text.append(text.strip())
-                    
-                    # Verifica se a linha contém dados temporais
-                    full_row_text = ' '.join(row_text)
-                    if re.search(time_pattern, full_row_text):
-                        movement_data.append({
-                            'timestamp_extracted': datetime.now().isoformat(),
-                            'row_data': row_text,
-                            'full_text': full_row_text
-                        })
-                        
-        except Exception as e:
-            self.logger.debug(f"Erro ao extrair histórico de movimentação: {e}")
-        
-        return movement_data
-    
-    async def _extract_additional_stats(self):
+    def _extract_additional_stats(self, snapshot, now_iso):
         """Extrai estatísticas adicionais da página"""
+        page_stats = snapshot['page_stats']
         stats = {}
         
-        try:
-            # Conta elementos específicos
-            stats['total_tables'] = len(await self.page.query_selector_all('table'))
-            stats['total_links'] = len(await self.page.query_selector_all('a'))
-            stats['page_load_time'] = datetime.now().isoformat()
-            
-            # Extrai meta informações
-            meta_elements = await self.page.query_selector_all('meta')
-            meta_info = {}
-            
-            for meta in meta_elements:
-                name = await meta.get_attribute('name')
-                content = await meta.get_attribute('content')
-                if name and content:
-                    meta_info[name] = content
-            
-            if meta_info:
-                stats['meta_info'] = meta_info
-                
-        except Exception as e:
-            self.logger.debug(f"Erro ao extrair estatísticas adicionais: {e}")
+        # Conta elementos específicos
+        if 'total_tables' in page_stats:
+            stats['total_tables'] = page_stats['total_tables']
+            stats['total_links'] = page_stats['total_links']
+        stats['page_load_time'] = now_iso
+        
+        # Meta informações
+        if page_stats.get('meta_info'):
+            stats['meta_info'] = page_stats['meta_info']
         
         return stats
     
-    def _calculate_analysis_metrics(self, game_data):
+    def _calculate_analysis_metrics(self, game_data, now_iso):
         """Calcula métricas de análise do jogo"""
         metrics = {
-            'analysis_timestamp': datetime.now().isoformat(),
+            'analysis_timestamp': now_iso,
             'data_completeness_score': 0,
             'betting_activity_level': 'unknown',
             'data_quality_indicators': []
@@ -371,35 +641,39 @@ class GameAnalyzer:
             # Avalia nível de atividade de apostas
             betting_tables = game_data.get('betting_tables', {})
             if betting_tables:
-                total_rows = sum(table.get('row_count', 0) for table in betting_tables.values() if isinstance(table, dict))
-                if total_rows > 20:
-                    metrics['betting_activity_level'] = 'high'
-                elif total_rows > 10:
-                    metrics['betting_activity_level'] = 'medium'
-                else:
-                    metrics['betting_activity_level'] = 'low'
+                # As tabelas têm sempre o formato de _extract_table_data; as
+                # listas de No/Yes ficam de fora da contagem
+                total_rows = sum(
+                    table['row_count']
+                    for name, table in betting_tables.items()
+                    if name not in _NO_YES_KEYS
+                )
+                metrics['betting_activity_level'] = next(
+                    level for threshold, level in _ACTIVITY_THRESHOLDS
+                    if total_rows > threshold
+                )
             
             # Indicadores de qualidade
-            if game_data.get('teams'):
-                metrics['data_quality_indicators'].append('teams_identified')
-            if betting_tables:
-                metrics['data_quality_indicators'].append('betting_data_available')
-            if game_data.get('movement_history'):
-                metrics['data_quality_indicators'].append('historical_data_available')
+            metrics['data_quality_indicators'] = [
+                name for name, present in (
+                    ('teams_identified', game_data.get('teams')),
+                    ('betting_data_available', betting_tables),
+                    ('historical_data_available', game_data.get('movement_history'))
+                )
+                if present
+            ]
                 
         except Exception as e:
             self.logger.debug(f"Erro ao calcular métricas: {e}")
         
         return metrics
     
-    def _extract_game_id_from_url(self, url):
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_game_id_from_url(url):
         """Extrai o ID do jogo da URL"""
-        try:
-            parsed_url = urlparse(url)
-            query_params = parse_qs(parsed_url.query)
-            return query_params.get('id', [None])[0]
-        except:
-            return None
+        match = _ID_RE.search(url) if url else None
+        return match.group(1) if match else None
     
     async def analyze_multiple_games(self, game_urls_or_data):
         """Analisa múltiplos jogos
@@ -409,34 +683,48 @@ class GameAnalyzer:
         """
         self.logger.info(f"🎯 Iniciando análise de {len(game_urls_or_data)} jogos")
         
-        for i, game_item in enumerate(game_urls_or_data):
-            try:
-                if isinstance(game_item, str):
-                    # É uma URL
-                    game_url = game_item
-                    game_info = None
-                else:
-                    # É um dicionário com dados
-                    game_url = game_item.get('game_link') or game_item.get('url')
-                    game_info = game_item
-                
-                if not game_url:
-                    self.logger.warning(f"⚠️ Jogo {i+1}: URL não encontrada")
-                    continue
-                
-                self.logger.info(f"📊 Analisando jogo {i+1}/{len(game_urls_or_data)}")
-                
-                analyzed_game = await self.analyze_game_from_url(game_url, game_info)
-                if analyzed_game:
-                    self.analyzed_games.append(analyzed_game)
-                
-                self.stats['total_analyzed'] += 1
-                
-                # Pausa entre análises para não sobrecarregar o servidor
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                self.logger.error(f"❌ Erro ao processar jogo {i+1}: {e}")
+        # Cada worker usa uma página própria, num dos contextos em rodízio
+        semaphore = asyncio.Semaphore(EXTRACTION_CONFIG['individual_analysis_concurrency'])
+        total = len(game_urls_or_data)
+        
+        async def analyze_item(i, game_item):
+            if isinstance(game_item, str):
+                # É uma URL
+                game_url = game_item
+                game_info = None
+            else:
+                # É um dicionário com dados
+                game_url = game_item.get('game_link') or game_item.get('url')
+                game_info = game_item
+            
+            if not game_url:
+                self.logger.warning(f"⚠️ Jogo {i+1}: URL não encontrada")
+                return None
+            
+            async with semaphore:
+                page = await self.contexts[i % len(self.contexts)].new_page()
+                try:
+                    self.logger.info(f"📊 Analisando jogo {i+1}/{total}")
+                    analyzed_game = await self.analyze_game_from_url(game_url, game_info, page)
+                    self.stats['total_analyzed'] += 1
+                    
+                    # Pausa do worker para não sobrecarregar o servidor
+                    await asyncio.sleep(EXTRACTION_CONFIG['individual_analysis_delay'])
+                    return analyzed_game
+                finally:
+                    await page.close()
+        
+        results = await asyncio.gather(
+            *[analyze_item(i, game_item) for i, game_item in enumerate(game_urls_or_data)],
+            return_exceptions=True
+        )
+        
+        # Mantém a ordem original dos jogos
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                self.logger.error(f"❌ Erro ao processar jogo {i+1}: {result}")
+            elif result:
+                self.analyzed_games.append(result)
         
         self.logger.info(f"✅ Análise concluída: {len(self.analyzed_games)} jogos analisados com sucesso")
     
@@ -451,18 +739,22 @@ class GameAnalyzer:
         # Salva dados detalhados
         detailed_file = DATA_DIR / f"detailed_analysis_{timestamp}.json"
         
-        analysis_data = {
-            'extraction_info': {
-                'timestamp': datetime.now().isoformat(),
-                'total_games_analyzed': len(self.analyzed_games),
-                'statistics': self.stats
-            },
-            'games': self.analyzed_games
+        extraction_info = {
+            'timestamp': datetime.now().isoformat(),
+            'total_games_analyzed': len(self.analyzed_games),
+            'statistics': self.stats
         }
         
+        # A serialização e a escrita rodam numa thread, liberando o event loop
+        loop = asyncio.get_running_loop()
+        
         try:
-            with open(detailed_file, 'w', encoding='utf-8') as f:
-                json.dump(analysis_data, f, indent=2, ensure_ascii=False)
+            # Os jogos são gravados um a um, sem montar o documento inteiro
+            await loop.run_in_executor(
+                None, save_json_stream,
+                {'extraction_info': extraction_info}, 'games',
+                self.analyzed_games, detailed_file
+            )
             
             self.logger.info(f"💾 Análise detalhada salva: {detailed_file}")
             
@@ -476,15 +768,14 @@ class GameAnalyzer:
                         'game_id': game.get('game_id'),
                         'teams': game.get('teams'),
                         'url': game.get('url'),
-                        'tables_found': len(game.get('betting_tables', {})),
-                        'data_completeness': game.get('analysis_metrics', {}).get('data_completeness_score', 0)
+                        'tables_found': len(game['betting_tables']),
+                        'data_completeness': game['analysis_metrics']['data_completeness_score']
                     }
                     for game in self.analyzed_games
                 ]
             }
             
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                json.dump(summary_data, f, indent=2, ensure_ascii=False)
+            await loop.run_in_executor(None, save_json_file, summary_data, summary_file)
             
             self.logger.info(f"📋 Resumo da análise salvo: {summary_file}")
             
@@ -506,8 +797,8 @@ class GameAnalyzer:
             print(f"\n🎮 JOGOS ANALISADOS:")
             for i, game in enumerate(self.analyzed_games[:5], 1):  # Mostra apenas os primeiros 5
                 teams = game.get('teams', 'N/A')
-                tables_count = len(game.get('betting_tables', {}))
-                completeness = game.get('analysis_metrics', {}).get('data_completeness_score', 0)
+                tables_count = len(game['betting_tables'])
+                completeness = game['analysis_metrics']['data_completeness_score']
                 print(f"  {i}. {teams} - {tables_count} tabelas - {completeness:.1%} completo")
             
             if len(self.analyzed_games) > 5:
@@ -516,15 +807,27 @@ class GameAnalyzer:
         print("="*60)
     
     async def cleanup(self):
-        """Limpa recursos"""
-        if self.browser:
-            await self.browser.close()
-            self.logger.info("🧹 Navegador fechado")
+        """Limpa recursos (fecha os contextos; o navegador compartilhado continua aberto)"""
+        for context in self.contexts:
+            await context.close()
+        
+        if self.contexts:
+            self.logger.info("🧹 Contextos de análise fechados")
+        
+        self.contexts = []
+        self.page = None
+        
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
 
 # Função de conveniência para análise rápida
 async def analyze_single_game(game_url, save_results=True):
     """Analisa um único jogo
     
+    Reaproveita o navegador compartilhado entre chamadas; chame
+    shutdown_pool() ao final da aplicação para fechá-lo.
+    
     Args:
         game_url (str): URL do jogo para análise
         save_results (bool): Se deve salvar os resultados
@@ -553,7 +856,11 @@ if __name__ == "__main__":
     example_url = "https://www.excapper.com/?action=game&id=34705909"
     
     async def main():
-        result = await analyze_single_game(example_url)
+        try:
+            result = await analyze_single_game(example_url)
+        finally:
+            await shutdown_pool()
+        
         if result:
             print(f"\n✅ Jogo analisado: {result.get('teams', 'N/A')}")
             print(f"📊 Tabelas encontradas: {len(result.get('betting_tables', {}))}")
@@ -7,26 +7,118 @@ Este módulo utiliza a API do Google Gemini para fornecer análises
 mais sofisticadas e insights sobre mercados de apostas.
 """
 
-import json
+import re
 import sys
-import os
-from typing import Dict, List, Optional, Any
+import json
+import time
+import asyncio
+import hashlib
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass
 
-# Adicionar o diretório de configuração ao path
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config'))
+from config.api_keys import get_gemini_api_key, validate_gemini_key, GEMINI_CONFIG
+from utils.helpers import parse_json
+from utils.cache import get_cached, set_cached
+from utils.rate_limiter import AsyncRateLimiter
 
 try:
     import google.generativeai as genai
-    from api_keys import get_gemini_api_key, validate_gemini_key, GEMINI_CONFIG
     GEMINI_AVAILABLE = True
 except ImportError:
     GEMINI_AVAILABLE = False
     print("⚠️ Google Generative AI não instalado. Execute: pip install google-generativeai")
 
-@dataclass
+try:
+    # SDK google-genai, usado apenas pelo modo batch
+    from google import genai as genai_batch
+    GENAI_BATCH_AVAILABLE = True
+except ImportError:
+    GENAI_BATCH_AVAILABLE = False
+
+# Decodificador usado para localizar o objeto JSON dentro de texto livre
+_JSON_DECODER = json.JSONDecoder()
+
+def _decode_json_block(text: str, start: int, end: int) -> Any:
+    """
+    Decodifica o bloco JSON de uma resposta do Gemini.
+    
+    O trecho entre a primeira '{' e a última '}' é decodificado de uma vez;
+    se houver texto com chaves antes ou depois do JSON, procura o primeiro
+    objeto completo a partir de cada '{', ignorando o que vem depois dele.
+    
+    Args:
+        text: Texto da resposta
+        start: Posição da primeira '{'
+        end: Posição logo após a última '}'
+        
+    Returns:
+        Any: Objeto decodificado
+        
+    Raises:
+        json.JSONDecodeError: Se nenhum objeto JSON válido for encontrado
+    """
+    try:
+        return parse_json(text[start:end])
+    except json.JSONDecodeError as error:
+        first_error = error
+    
+    while start >= 0:
+        try:
+            data, _ = _JSON_DECODER.raw_decode(text, start)
+            if isinstance(data, dict):
+                return data
+        except json.JSONDecodeError:
+            pass
+        start = text.find('{', start + 1)
+    
+    raise first_error
+
+# Barras de confiança de 0 a 10 blocos, indexadas por int(confidence * 10)
+_CONFIDENCE_BARS = tuple("█" * filled + "░" * (10 - filled) for filled in range(11))
+
+# Parte fixa do prompt de análise (instruções e formato da resposta)
+_PROMPT_INSTRUCTIONS = """**INSTRUÇÕES PARA ANÁLISE:**
+1. Identifique padrões nos volumes e odds
+2. Avalie oportunidades de valor
+3. Considere riscos e volatilidade
+4. Forneça recomendações específicas
+5. Avalie o contexto temporal (se ao vivo)
+
+**FORMATO DE RESPOSTA (JSON):**
+{
+    "analysis": "Análise detalhada dos mercados e oportunidades identificadas",
+    "confidence": 0.85,
+    "recommendations": [
+        "Recomendação específica 1",
+        "Recomendação específica 2"
+    ],
+    "risk_assessment": "Avaliação de risco (Baixo/Médio/Alto)",
+    "market_insights": {
+        "best_market": "Nome do melhor mercado",
+        "volume_analysis": "Análise dos volumes",
+        "odds_movement": "Análise do movimento das odds",
+        "timing": "Melhor momento para apostar"
+    }
+}
+
+Responda APENAS com o JSON válido, sem texto adicional.
+"""
+
+def _has_live_selection(market_data: List[Dict]) -> bool:
+    """Indica se algum mercado tem a seleção 'Type' com odds 'live'"""
+    for market in market_data:
+        for selection in market.get('selections') or ():
+            # Compara odds primeiro: é barato e descarta quase todas as seleções
+            if selection.get('odds') == 'live' and selection.get('name', '').lower() == 'type':
+                return True
+    return False
+
+# slots=True (Python 3.10+) dispensa o __dict__ de cada instância
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class GeminiAnalysis:
-    """Resultado da análise do Gemini."""
+    """Resultado da análise do Gemini (imutável depois de criado)."""
     success: bool
     analysis: str
     confidence: float
@@ -42,6 +134,10 @@ class GeminiAnalyzer:
         self.model = None
         self.initialized = False
         
+        # Limite de requisições por minuto da conta, compartilhado pelas chamadas assíncronas
+        max_rate = GEMINI_CONFIG.get('max_requests_per_minute')
+        self.rate_limiter = AsyncRateLimiter(max_rate, 60) if max_rate else None
+        
         if GEMINI_AVAILABLE and validate_gemini_key():
             try:
                 # Configurar a API do Gemini
@@ -72,14 +168,18 @@ class GeminiAnalyzer:
             # Preparar prompt para o Gemini
             prompt = self._create_analysis_prompt(market_data, game_context)
             
+            # Mercados inalterados reaproveitam a resposta anterior
+            cache_key = self._cache_key(prompt)
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return self._process_gemini_response(cached)
+            
             # Gerar análise com Gemini
             response = self.model.generate_content(
                 prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=GEMINI_CONFIG['temperature'],
-                    max_output_tokens=GEMINI_CONFIG['max_tokens']
-                )
+                generation_config=self._generation_config()
             )
+            self._store_response(cache_key, response.text)
             
             # Processar resposta
             return self._process_gemini_response(response.text)
@@ -88,6 +188,99 @@ class GeminiAnalyzer:
             print(f"❌ Erro na análise Gemini: {e}")
             return self._fallback_analysis(market_data, str(e))
     
+    async def analyze_betting_markets_async(self, market_data: List[Dict], game_context: Dict = None) -> GeminiAnalysis:
+        """
+        Versão assíncrona de analyze_betting_markets.
+        
+        A chamada ao Gemini não bloqueia o event loop, permitindo que várias
+        análises aguardem a rede ao mesmo tempo.
+        
+        Args:
+            market_data: Dados dos mercados extraídos
+            game_context: Contexto adicional do jogo (times, liga, etc.)
+            
+        Returns:
+            GeminiAnalysis: Análise completa do Gemini
+        """
+        if not self.initialized:
+            return self._fallback_analysis(market_data)
+        
+        try:
+            prompt = self._create_analysis_prompt(market_data, game_context)
+            
+            cache_key = self._cache_key(prompt)
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return self._process_gemini_response(cached)
+            
+            if self.rate_limiter:
+                await self.rate_limiter.wait()
+            
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config=self._generation_config()
+            )
+            self._store_response(cache_key, response.text)
+            
+            return self._process_gemini_response(response.text)
+            
+        except Exception as e:
+            print(f"❌ Erro na análise Gemini: {e}")
+            return self._fallback_analysis(market_data, str(e))
+    
+    async def analyze_many(self, jobs: Sequence[Tuple[List[Dict], Optional[Dict]]],
+                           max_concurrency: int = None) -> List[GeminiAnalysis]:
+        """
+        Analisa vários jogos em paralelo.
+        
+        Args:
+            jobs: Pares (market_data, game_context), um por jogo
+            max_concurrency: Máximo de chamadas simultâneas ao Gemini, para
+                respeitar o limite de requisições por minuto da conta
+                (padrão: GEMINI_CONFIG['max_concurrency'])
+            
+        Returns:
+            List[GeminiAnalysis]: Análises na mesma ordem de `jobs`
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or GEMINI_CONFIG['max_concurrency'])
+        
+        async def analyze_job(market_data, game_context):
+            async with semaphore:
+                return await self.analyze_betting_markets_async(market_data, game_context)
+        
+        return await asyncio.gather(
+            *(analyze_job(market_data, game_context) for market_data, game_context in jobs)
+        )
+    
+    def _generation_config(self):
+        """Parâmetros de geração usados em todas as chamadas ao Gemini."""
+        return genai.types.GenerationConfig(
+            temperature=GEMINI_CONFIG['temperature'],
+            max_output_tokens=GEMINI_CONFIG['max_tokens']
+        )
+    
+    def _cache_key(self, prompt: str) -> str:
+        """
+        Chave de cache de uma análise: hash do modelo e do prompt.
+        
+        O prompt já inclui a data/hora do jogo (game_context['datetime']), de
+        modo que o mesmo mercado em outro momento gera outra chave.
+        """
+        digest = hashlib.blake2b(f"{GEMINI_CONFIG['model']}\n{prompt}".encode(), digest_size=16)
+        return f"gemini:{digest.hexdigest()}"
+    
+    def _cached_response(self, cache_key: str) -> Optional[str]:
+        """Resposta gravada para a chave, se ainda dentro de GEMINI_CONFIG['cache_ttl']"""
+        ttl = GEMINI_CONFIG.get('cache_ttl', 0)
+        if ttl <= 0:
+            return None
+        return get_cached(cache_key, ttl)
+    
+    def _store_response(self, cache_key: str, response_text: str) -> None:
+        """Grava a resposta do Gemini no cache local"""
+        if GEMINI_CONFIG.get('cache_ttl', 0) > 0:
+            set_cached(cache_key, response_text)
+    
     def _create_analysis_prompt(self, market_data: List[Dict], game_context: Dict = None) -> str:
         """
         Cria um prompt estruturado para análise do Gemini.
@@ -109,56 +302,27 @@ class GeminiAnalyzer:
 - Status: {game_context.get('status', 'N/A')}
 """
         
-        markets_info = ""
+        markets_parts = []
         for i, market in enumerate(market_data[:5], 1):  # Limitar a 5 mercados
-            markets_info += f"""
+            markets_parts.append(f"""
 **MERCADO {i}: {market.get('market_name', 'N/A')}**
-"""
+""")
             for selection in market.get('selections', [])[:8]:  # Limitar seleções
-                name = selection.get('name', 'N/A')
-                odds = selection.get('odds', 'N/A')
-                markets_info += f"- {name}: {odds}\n"
+                markets_parts.append(f"- {selection.get('name', 'N/A')}: {selection.get('odds', 'N/A')}\n")
             
             if market.get('links', {}).get('betfair_url'):
-                markets_info += f"- Betfair: {market['links']['betfair_url']}\n"
-            markets_info += "\n"
+                markets_parts.append(f"- Betfair: {market['links']['betfair_url']}\n")
+            markets_parts.append("\n")
         
-        prompt = f"""
+        return f"""
 Você é KAIROS, uma IA especialista em análise de apostas esportivas da Betfair. Analise os dados abaixo e forneça insights profissionais.
 
 {context_info}
 
 **DADOS DOS MERCADOS:**
-{markets_info}
+{''.join(markets_parts)}
 
-**INSTRUÇÕES PARA ANÁLISE:**
-1. Identifique padrões nos volumes e odds
-2. Avalie oportunidades de valor
-3. Considere riscos e volatilidade
-4. Forneça recomendações específicas
-5. Avalie o contexto temporal (se ao vivo)
-
-**FORMATO DE RESPOSTA (JSON):**
-{{
-    "analysis": "Análise detalhada dos mercados e oportunidades identificadas",
-    "confidence": 0.85,
-    "recommendations": [
-        "Recomendação específica 1",
-        "Recomendação específica 2"
-    ],
-    "risk_assessment": "Avaliação de risco (Baixo/Médio/Alto)",
-    "market_insights": {{
-        "best_market": "Nome do melhor mercado",
-        "volume_analysis": "Análise dos volumes",
-        "odds_movement": "Análise do movimento das odds",
-        "timing": "Melhor momento para apostar"
-    }}
-}}
-
-Responda APENAS com o JSON válido, sem texto adicional.
-"""
-        
-        return prompt
+{_PROMPT_INSTRUCTIONS}"""
     
     def _process_gemini_response(self, response_text: str) -> GeminiAnalysis:
         """
@@ -176,8 +340,7 @@ Responda APENAS com o JSON válido, sem texto adicional.
             json_end = response_text.rfind('}') + 1
             
             if json_start >= 0 and json_end > json_start:
-                json_text = response_text[json_start:json_end]
-                data = json.loads(json_text)
+                data = _decode_json_block(response_text, json_start, json_end)
                 
                 return GeminiAnalysis(
                     success=True,
@@ -232,11 +395,7 @@ Responda APENAS com o JSON válido, sem texto adicional.
         """
         # Análise básica local
         total_markets = len(market_data)
-        has_live_markets = any(
-            any(sel.get('name', '').lower() == 'type' and sel.get('odds') == 'live' 
-                for sel in market.get('selections', []))
-            for market in market_data
-        )
+        has_live_markets = _has_live_selection(market_data)
         
         analysis = f"Análise local de {total_markets} mercados. "
         if has_live_markets:
@@ -278,9 +437,9 @@ Responda APENAS com o JSON válido, sem texto adicional.
             str: Análise formatada
         """
         status_icon = "✅" if analysis.success else "❌"
-        confidence_bar = "█" * int(analysis.confidence * 10) + "░" * (10 - int(analysis.confidence * 10))
+        confidence_bar = _CONFIDENCE_BARS[max(0, min(10, int(analysis.confidence * 10)))]
         
-        result = f"""
+        parts = [f"""
 🧠 **ANÁLISE GEMINI AI** {status_icon}
 
 📊 **Confiança:** {analysis.confidence:.1%} [{confidence_bar}]
@@ -290,20 +449,179 @@ Responda APENAS com o JSON válido, sem texto adicional.
 {analysis.analysis}
 
 💡 **Recomendações:**
-"""
+"""]
         
-        for i, rec in enumerate(analysis.recommendations, 1):
-            result += f"{i}. {rec}\n"
+        parts.extend(f"{i}. {rec}\n" for i, rec in enumerate(analysis.recommendations, 1))
         
         if analysis.market_insights:
-            result += "\n🔍 **Insights dos Mercados:**\n"
-            for key, value in analysis.market_insights.items():
-                result += f"• {key.replace('_', ' ').title()}: {value}\n"
+            parts.append("\n🔍 **Insights dos Mercados:**\n")
+            parts.extend(
+                f"• {key.replace('_', ' ').title()}: {value}\n"
+                for key, value in analysis.market_insights.items()
+            )
         
         if analysis.error_message:
-            result += f"\n⚠️ **Aviso:** {analysis.error_message}"
+            parts.append(f"\n⚠️ **Aviso:** {analysis.error_message}")
         
-        return result
+        return ''.join(parts)
+
+class GeminiBatchAnalyzer:
+    """
+    Análise de mercados pelo modo batch do Gemini.
+    
+    Para análises sem urgência: todos os prompts são enviados num único job,
+    processado de forma assíncrona pelo Google a um custo menor que o das
+    chamadas individuais. Requer o SDK google-genai.
+    """
+    
+    # Estados finais de um job batch
+    _TERMINAL_STATES = frozenset([
+        'JOB_STATE_SUCCEEDED', 'JOB_STATE_FAILED',
+        'JOB_STATE_CANCELLED', 'JOB_STATE_EXPIRED'
+    ])
+    
+    # O nome do job guarda quantos pedidos foram enviados, para que collect
+    # confira as respostas mesmo em outro processo
+    _DISPLAY_NAME = "kairos-{count}-mercados"
+    _DISPLAY_NAME_RE = re.compile(r'^kairos-(\d+)-mercados$')
+    
+    def __init__(self):
+        self.client = None
+        self.initialized = False
+        # Reaproveita a montagem de prompts e a leitura das respostas
+        self.analyzer = get_shared_analyzer()
+        
+        if GENAI_BATCH_AVAILABLE and validate_gemini_key():
+            try:
+                self.client = genai_batch.Client(api_key=get_gemini_api_key())
+                self.initialized = True
+            except Exception as e:
+                print(f"❌ Erro ao inicializar o modo batch do Gemini: {e}")
+        else:
+            print("⚠️ Modo batch do Gemini não disponível. Execute: pip install google-genai")
+    
+    def submit(self, jobs: Sequence[Tuple[List[Dict], Optional[Dict]]]) -> str:
+        """
+        Envia as análises num único job batch.
+        
+        Args:
+            jobs: Pares (market_data, game_context), um por jogo
+            
+        Returns:
+            str: Identificador do job batch
+            
+        Raises:
+            RuntimeError: Se o modo batch não estiver disponível
+        """
+        if not self.initialized:
+            raise RuntimeError("Modo batch do Gemini não disponível")
+        
+        jobs = list(jobs)
+        requests = [
+            {
+                'contents': [{
+                    'role': 'user',
+                    'parts': [{'text': self.analyzer._create_analysis_prompt(market_data, game_context)}]
+                }],
+                'config': {
+                    'temperature': GEMINI_CONFIG['temperature'],
+                    'max_output_tokens': GEMINI_CONFIG['max_tokens']
+                }
+            }
+            for market_data, game_context in jobs
+        ]
+        
+        batch_job = self.client.batches.create(
+            model=GEMINI_CONFIG['model'],
+            src=requests,
+            config={'display_name': self._DISPLAY_NAME.format(count=len(jobs))}
+        )
+        
+        print(f"📤 Job batch do Gemini enviado: {batch_job.name} ({len(jobs)} análises)")
+        return batch_job.name
+    
+    def poll(self, batch_id: str) -> str:
+        """
+        Consulta o estado de um job batch.
+        
+        Returns:
+            str: Estado do job (ex.: 'JOB_STATE_RUNNING', 'JOB_STATE_SUCCEEDED')
+        """
+        return self.client.batches.get(name=batch_id).state.name
+    
+    def collect(self, batch_id: str, poll_interval: float = None, timeout: float = None) -> List[GeminiAnalysis]:
+        """
+        Aguarda o fim do job batch e converte as respostas.
+        
+        Usa apenas o que está salvo no job, então funciona também em outro
+        processo, a partir do identificador retornado por submit.
+        
+        Args:
+            batch_id: Identificador retornado por submit
+            poll_interval: Segundos entre consultas (padrão: GEMINI_CONFIG['batch_poll_interval'])
+            timeout: Tempo máximo de espera em segundos (padrão: sem limite)
+            
+        Returns:
+            List[GeminiAnalysis]: Análises na mesma ordem dos jobs enviados;
+                pedidos com erro recebem a análise local
+            
+        Raises:
+            TimeoutError: Se o job não terminar dentro de `timeout`
+            RuntimeError: Se o job terminar sem sucesso ou se o número de
+                respostas não bater com o de pedidos enviados
+        """
+        poll_interval = poll_interval or GEMINI_CONFIG['batch_poll_interval']
+        deadline = time.monotonic() + timeout if timeout else None
+        
+        batch_job = self.client.batches.get(name=batch_id)
+        while batch_job.state.name not in self._TERMINAL_STATES:
+            if deadline and time.monotonic() >= deadline:
+                raise TimeoutError(f"Job batch {batch_id} não terminou em {timeout}s")
+            time.sleep(poll_interval)
+            batch_job = self.client.batches.get(name=batch_id)
+        
+        state = batch_job.state.name
+        if state != 'JOB_STATE_SUCCEEDED':
+            raise RuntimeError(f"Job batch {batch_id} terminou com estado {state}")
+        
+        # As respostas inline seguem a ordem dos pedidos; com uma a mais ou a
+        # menos, as análises ficariam atribuídas aos jogos errados
+        responses = (batch_job.dest.inlined_responses if batch_job.dest else None) or []
+        name_match = self._DISPLAY_NAME_RE.match(batch_job.display_name or '')
+        if not name_match:
+            raise RuntimeError(f"Job batch {batch_id} não foi criado por submit")
+        expected = int(name_match.group(1))
+        if len(responses) != expected:
+            raise RuntimeError(
+                f"Job batch {batch_id} retornou {len(responses)} respostas para {expected} pedidos"
+            )
+        
+        results = []
+        for inline in responses:
+            if inline.response is not None:
+                results.append(self.analyzer._process_gemini_response(inline.response.text))
+            else:
+                error = str(inline.error) if inline.error else "Resposta ausente no job batch"
+                results.append(self.analyzer._fallback_analysis([], error))
+        
+        print(f"✅ Job batch {batch_id} concluído: {len(results)} análises")
+        return results
+
+# Analisador compartilhado: a configuração do SDK e o modelo são criados uma
+# única vez e as conexões com a API são reaproveitadas entre as análises
+_SHARED_ANALYZER: Optional[GeminiAnalyzer] = None
+
+def get_shared_analyzer() -> GeminiAnalyzer:
+    """
+    Retorna o GeminiAnalyzer compartilhado, criando-o na primeira chamada.
+    
+    Returns:
+        GeminiAnalyzer: Instância única do analisador
+    """
+    global _SHARED_ANALYZER
+    if _SHARED_ANALYZER is None:
+        _SHARED_ANALYZER = GeminiAnalyzer()
+    return _SHARED_ANALYZER
 
 # Função principal para uso externo
 def analyze_with_gemini(market_data: List[Dict], game_context: Dict = None) -> str:
@@ -317,10 +635,25 @@ def analyze_with_gemini(market_data: List[Dict], game_context: Dict = None) -> s
     Returns:
         str: Análise formatada
     """
-    analyzer = GeminiAnalyzer()
+    analyzer = get_shared_analyzer()
     analysis = analyzer.analyze_betting_markets(market_data, game_context)
     return analyzer.format_analysis_result(analysis)
 
+async def analyze_with_gemini_async(market_data: List[Dict], game_context: Dict = None) -> str:
+    """
+    Versão assíncrona de analyze_with_gemini, para uso dentro do event loop.
+    
+    Args:
+        market_data: Dados dos mercados
+        game_context: Contexto do jogo
+        
+    Returns:
+        str: Análise formatada
+    """
+    analyzer = get_shared_analyzer()
+    analysis = await analyzer.analyze_betting_markets_async(market_data, game_context)
+    return analyzer.format_analysis_result(analysis)
+
 if __name__ == "__main__":
     # Teste da integração Gemini
     print("🧠 Testando integração com Gemini...")
@@ -6,49 +6,190 @@ Investiga jogos individuais e coleta dados detalhados
 """
 
 import asyncio
-import json
 from datetime import datetime
 from pathlib import Path
-from playwright.async_api import async_playwright
 
 from config.settings import (
     BASE_URL, PLAYWRIGHT_CONFIG, TIMEOUTS, SELECTORS,
-    FILE_PATTERNS, DATA_DIR
+    DATA_DIR, INVESTIGATION_CONFIG, build_filename
 )
 from utils.logger import get_logger, LogContext
+from utils.rate_limiter import AsyncRateLimiter
+from modules._browser_pool import get_browser, shutdown_pool
 from utils.helpers import (
-    format_timestamp, validate_url, load_json_file,
-    save_json_file, generate_game_hash
+    format_timestamp, validate_url, load_json_file, load_jsonl_file,
+    save_json_file, generate_game_hash, dump_json_line
 )
 
+# Scripts executados no navegador: cada extrator lê todos os elementos de que
+# precisa numa única chamada e devolve apenas dados simples
+
+# Texto (e, se pedido, HTML) dos elementos de cada seletor; um seletor
+# inválido não afeta os demais
+_DETAILS_EXTRACT_JS = """
+([selectors, captureHtml]) => {
+    const result = {};
+    for (const [infoType, selector] of Object.entries(selectors)) {
+        try {
+            const elements = document.querySelectorAll(selector);
+            if (elements.length) {
+                result[infoType] = Array.from(elements, el => (
+                    captureHtml ? {text: el.innerText || '', html: el.innerHTML} : {text: el.innerText || ''}
+                ));
+            }
+        } catch (e) {
+            result[infoType] = {error: String(e)};
+        }
+    }
+    return result;
+}
+"""
+
+# Título da página e meta tags por name (ou property, na falta do name)
+_METADATA_EXTRACT_JS = """
+() => {
+    const metadata = {};
+    for (const meta of document.querySelectorAll('meta')) {
+        const name = meta.getAttribute('name');
+        const property = meta.getAttribute('property');
+        const content = meta.getAttribute('content');
+        if (name && content) {
+            metadata[name] = content;
+        } else if (property && content) {
+            metadata[property] = content;
+        }
+    }
+    return {title: document.title, metadata: metadata};
+}
+"""
+
+# Elementos de odds; o filtro de palavras-chave roda no navegador para que
+# os elementos descartados não sejam transferidos. Os seletores se sobrepõem
+# (ex.: '[class*="odd"]' inclui '.odds-table'), então cada elemento entra uma
+# única vez, com o primeiro seletor que o encontrou
+_ODDS_EXTRACT_JS = """
+([selectors, keywordsPattern, captureHtml]) => {
+    const keywords = new RegExp(keywordsPattern, 'i');
+    const seen = new Set();
+    const odds = [];
+    for (const selector of selectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (seen.has(el)) {
+                continue;
+            }
+            seen.add(el);
+            const text = el.innerText;
+            if (text && keywords.test(text)) {
+                const item = {selector: selector, text: text.trim()};
+                if (captureHtml) {
+                    item.html = el.innerHTML;
+                }
+                odds.push(item);
+            }
+        }
+    }
+    return odds;
+}
+"""
+
+_ODDS_SELECTORS = [
+    'table.odds',
+    '.odds-table',
+    '[class*="odd"]',
+    '[class*="bet"]'
+]
+# Palavras-chave de odds, como alternativas de uma regex (sem diferenciar maiúsculas)
+_ODDS_KEYWORDS_PATTERN = 'odd|bet|1x2|over|under'
+
+# Recursos não carregados nas páginas investigadas; o CSS é mantido pois
+# afeta o innerText dos elementos extraídos
+_BLOCKED_RESOURCE_TYPES = frozenset(PLAYWRIGHT_CONFIG['investigation_blocked_resource_types'])
+_BLOCKED_HOSTS = tuple(PLAYWRIGHT_CONFIG['blocked_hosts'])
+
+async def _block_unneeded_resources(route):
+    """Bloqueia imagens, fontes, mídia e rastreadores nas páginas investigadas"""
+    request = route.request
+    if (request.resource_type in _BLOCKED_RESOURCE_TYPES
+            or any(host in request.url for host in _BLOCKED_HOSTS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Hashes dos jogos já investigados com sucesso, um por linha, acumulados entre execuções
+_INVESTIGATED_HASHES_FILE = 'investigated_hashes.txt'
+
 class GameInvestigator:
     """Classe responsável pela investigação detalhada de jogos"""
     
     def __init__(self):
         self.logger = get_logger(__name__)
         self.browser = None
+        self.context = None
         self.page = None
         self.investigated_games = []
         self.failed_investigations = []
+        self.run_timestamp = format_timestamp()
+        self.stream_path = None
+        self.stream_file = None
+        self.known_hashes = set()
+        self.hashes_file = None
+        
+        # Orçamento de páginas por minuto compartilhado por todos os workers
+        max_rate = INVESTIGATION_CONFIG['max_games_per_minute']
+        self.rate_limiter = AsyncRateLimiter(max_rate, 60) if max_rate else None
     
     async def setup_browser(self):
         """Configura o navegador Playwright"""
         with LogContext(self.logger, "Configuração do navegador"):
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(
-                headless=PLAYWRIGHT_CONFIG['headless'],
-                args=PLAYWRIGHT_CONFIG['args']
-            )
+            # O navegador é compartilhado entre execuções; cada investigador só cria seu contexto
+            self.browser = await get_browser()
+            
+            # Cookies e armazenamento da execução anterior, se configurado
+            storage_state = PLAYWRIGHT_CONFIG['storage_state_path']
+            if storage_state and not Path(storage_state).is_file():
+                storage_state = None
             
-            context = await self.browser.new_context(
+            self.context = await self.browser.new_context(
                 viewport=PLAYWRIGHT_CONFIG['viewport'],
-                user_agent=PLAYWRIGHT_CONFIG['user_agent']
+                user_agent=PLAYWRIGHT_CONFIG['user_agent'],
+                storage_state=storage_state
             )
+            # Vale para todas as páginas do contexto, inclusive as dos workers
+            await self.context.route("**/*", _block_unneeded_resources)
             
-            self.page = await context.new_page()
+            self.page = await self.context.new_page()
+        
+        # Opcionalmente grava cada jogo investigado assim que termina
+        if INVESTIGATION_CONFIG['stream_results_jsonl']:
+            self.stream_path = DATA_DIR / build_filename('investigation_stream', self.run_timestamp)
+            self.stream_path.parent.mkdir(parents=True, exist_ok=True)
+            self.stream_file = open(self.stream_path, 'wb')
+        
+        # Opcionalmente pula jogos já investigados em execuções anteriores
+        if INVESTIGATION_CONFIG['skip_investigated']:
+            self._load_known_hashes()
     
-    async def investigate_game(self, game_data):
-        """Investiga um jogo específico"""
+    def _load_known_hashes(self):
+        """Carrega os hashes já investigados e abre o arquivo para acrescentar os novos"""
+        hashes_path = DATA_DIR / _INVESTIGATED_HASHES_FILE
+        hashes_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if hashes_path.is_file():
+            with open(hashes_path, encoding='utf-8') as f:
+                self.known_hashes = {line.strip() for line in f if line.strip()}
+            self.logger.info(f"♻️ {len(self.known_hashes)} jogos já investigados serão pulados")
+        
+        self.hashes_file = open(hashes_path, 'a', encoding='utf-8')
+    
+    async def investigate_game(self, game_data, page=None, navigation=None):
+        """Investiga um jogo específico
+        
+        Args:
+            game_data (dict): Dados do jogo extraídos da listagem
+            page: Página do Playwright a usar (padrão: página principal)
+            navigation: Tarefa de _start_navigation que já carrega o jogo em `page`
+        """
+        page = page or self.page
         game_link = game_data.get('game_link')
         game_teams = game_data.get('teams', 'Jogo desconhecido')
         
@@ -61,23 +202,35 @@ class GameInvestigator:
             })
             return None
         
+        game_hash = generate_game_hash(game_data)
+        if self._already_investigated(game_hash):
+            self.logger.info(f"♻️ Jogo já investigado, pulando: {game_teams}")
+            return None
+        
         with LogContext(self.logger, f"Investigação: {game_teams}"):
             try:
-                # Navega para a página do jogo
-                await self.page.goto(
-                    game_link,
-                    wait_until=PLAYWRIGHT_CONFIG['wait_until'],
-                    timeout=TIMEOUTS['page_load']
-                )
+                # Navega para a página do jogo (ou aguarda a navegação já iniciada)
+                if navigation is not None:
+                    await navigation
+                else:
+                    await self._goto_game(page, game_link)
                 
                 # Aguarda carregamento do conteúdo
                 await asyncio.sleep(INVESTIGATION_CONFIG['wait_after_load'])
                 
                 # Extrai dados detalhados
-                detailed_data = await self._extract_detailed_data(game_data)
+                detailed_data = await self._extract_detailed_data(game_data, page, game_hash)
                 
                 if detailed_data:
                     self.investigated_games.append(detailed_data)
+                    if self.stream_file:
+                        # Uma linha por jogo, gravada já, para sobreviver a falhas
+                        self.stream_file.write(dump_json_line(detailed_data))
+                        self.stream_file.flush()
+                    if self.hashes_file:
+                        self.known_hashes.add(game_hash)
+                        self.hashes_file.write(game_hash + '\n')
+                        self.hashes_file.flush()
                     self.logger.info(f"✅ Investigação concluída: {game_teams}")
                     return detailed_data
                 else:
@@ -93,14 +246,44 @@ class GameInvestigator:
                 })
                 return None
     
-    async def _extract_detailed_data(self, original_game_data):
+    def _already_investigated(self, game_hash):
+        """Indica se o jogo deve ser pulado por já ter sido investigado"""
+        return game_hash in self.known_hashes and not INVESTIGATION_CONFIG['force_refresh']
+    
+    def _start_navigation(self, game_data, page):
+        """Começa a carregar a página do jogo em segundo plano
+        
+        Returns:
+            asyncio.Task ou None, se o jogo não será carregado (link inválido
+            ou já investigado); investigate_game trata esses casos
+        """
+        game_link = game_data.get('game_link')
+        if not game_link or not validate_url(game_link):
+            return None
+        if self.known_hashes and self._already_investigated(generate_game_hash(game_data)):
+            return None
+        
+        return asyncio.ensure_future(self._goto_game(page, game_link))
+    
+    async def _goto_game(self, page, game_link):
+        """Abre a página do jogo, respeitando o limite de páginas por minuto"""
+        if self.rate_limiter:
+            await self.rate_limiter.wait()
+        
+        await page.goto(
+            game_link,
+            wait_until=PLAYWRIGHT_CONFIG['wait_until'],
+            timeout=TIMEOUTS['page_load']
+        )
+    
+    async def _extract_detailed_data(self, original_game_data, page, game_hash=None):
         """Extrai dados detalhados da página do jogo"""
         detailed_data = {
             'original_data': original_game_data,
             'investigation_timestamp': datetime.now().isoformat(),
-            'game_hash': generate_game_hash(original_game_data),
-            'page_url': self.page.url,
-            'page_title': await self.page.title(),
+            'game_hash': game_hash or generate_game_hash(original_game_data),
+            'page_url': page.url,
+            'page_title': '',  # preenchido junto com os metadados
             'detailed_info': {}
         }
         
@@ -112,76 +295,51 @@ class GameInvestigator:
             'match_info': SELECTORS.get('match_info', '.match-details')
         }
         
-        for info_type, selector in selectors_to_extract.items():
-            try:
-                elements = await self.page.query_selector_all(selector)
-                if elements:
-                    info_data = []
-                    for element in elements:
-                        text_content = await element.inner_text()
-                        html_content = await element.inner_html()
-                        info_data.append({
-                            'text': text_content.strip(),
-                            'html': html_content
-                        })
-                    detailed_data['detailed_info'][info_type] = info_data
-                    self.logger.debug(f"📊 Extraído {info_type}: {len(info_data)} elementos")
-            except Exception as e:
-                self.logger.debug(f"⚠️ Erro ao extrair {info_type}: {e}")
+        try:
+            extracted = await page.evaluate(
+                _DETAILS_EXTRACT_JS,
+                [selectors_to_extract, INVESTIGATION_CONFIG['capture_html']]
+            )
+        except Exception as e:
+            self.logger.debug(f"⚠️ Erro ao extrair informações detalhadas: {e}")
+            extracted = {}
+        
+        for info_type, elements in extracted.items():
+            if isinstance(elements, dict):
+                self.logger.debug(f"⚠️ Erro ao extrair {info_type}: {elements['error']}")
+                continue
+            
+            info_data = [dict(element, text=element['text'].strip()) for element in elements]
+            detailed_data['detailed_info'][info_type] = info_data
+            self.logger.debug(f"📊 Extraído {info_type}: {len(info_data)} elementos")
         
         # Extrai metadados da página
-        await self._extract_page_metadata(detailed_data)
+        await self._extract_page_metadata(detailed_data, page)
         
         # Extrai informações de odds se disponível
-        await self._extract_odds_info(detailed_data)
+        await self._extract_odds_info(detailed_data, page)
         
         return detailed_data
     
-    async def _extract_page_metadata(self, detailed_data):
-        """Extrai metadados da página"""
+    async def _extract_page_metadata(self, detailed_data, page):
+        """Extrai título e metadados da página"""
         try:
-            # Meta tags
-            meta_tags = await self.page.query_selector_all('meta')
-            metadata = {}
-            
-            for meta in meta_tags:
-                name = await meta.get_attribute('name')
-                property_attr = await meta.get_attribute('property')
-                content = await meta.get_attribute('content')
-                
-                if name and content:
-                    metadata[name] = content
-                elif property_attr and content:
-                    metadata[property_attr] = content
-            
-            detailed_data['page_metadata'] = metadata
+            # Título e meta tags numa única chamada
+            page_info = await page.evaluate(_METADATA_EXTRACT_JS)
+            detailed_data['page_title'] = page_info['title']
+            detailed_data['page_metadata'] = page_info['metadata']
             
         except Exception as e:
             self.logger.debug(f"⚠️ Erro ao extrair metadados: {e}")
     
-    async def _extract_odds_info(self, detailed_data):
+    async def _extract_odds_info(self, detailed_data, page):
         """Extrai informações de odds/apostas"""
         try:
             # Procura por tabelas de odds
-            odds_selectors = [
-                'table.odds',
-                '.odds-table',
-                '[class*="odd"]',
-                '[class*="bet"]'
-            ]
-            
-            odds_data = []
-            
-            for selector in odds_selectors:
-                elements = await self.page.query_selector_all(selector)
-                for element in elements:
-                    text = await element.inner_text()
-                    if text and any(keyword in text.lower() for keyword in ['odd', 'bet', '1x2', 'over', 'under']):
-                        odds_data.append({
-                            'selector': selector,
-                            'text': text.strip(),
-                            'html': await element.inner_html()
-                        })
+            odds_data = await page.evaluate(
+                _ODDS_EXTRACT_JS,
+                [_ODDS_SELECTORS, _ODDS_KEYWORDS_PATTERN, INVESTIGATION_CONFIG['capture_html']]
+            )
             
             if odds_data:
                 detailed_data['odds_info'] = odds_data
@@ -190,11 +348,22 @@ class GameInvestigator:
         except Exception as e:
             self.logger.debug(f"⚠️ Erro ao extrair odds: {e}")
     
-    async def investigate_games_from_file(self, games_file_path):
-        """Investiga jogos a partir de um arquivo de dados"""
+    async def investigate_games_from_file(self, games_source):
+        """Investiga jogos a partir de um arquivo de dados
+        
+        Args:
+            games_source: Caminho do arquivo de jogos, ou os dados já carregados
+                (lista de jogos ou dicionário com a chave 'games')
+        """
         try:
-            games_data = load_json_file(Path(games_file_path))
-            games_list = games_data.get('games', [])
+            if isinstance(games_source, (list, dict)):
+                games_data = games_source
+            elif str(games_source).endswith('.jsonl'):
+                games_data = load_jsonl_file(Path(games_source))
+            else:
+                games_data = load_json_file(Path(games_source))
+            
+            games_list = games_data.get('games', []) if isinstance(games_data, dict) else games_data
             
             if not games_list:
                 self.logger.error("❌ Nenhum jogo encontrado no arquivo")
@@ -206,17 +375,22 @@ class GameInvestigator:
                 games_list = games_list[:max_investigations]
                 self.logger.info(f"🎯 Limitando investigação a {max_investigations} jogos")
             
-            self.logger.info(f"🔍 Iniciando investigação de {len(games_list)} jogos")
+            workers = min(INVESTIGATION_CONFIG['file_workers'], len(games_list))
+            self.logger.info(f"🔍 Iniciando investigação de {len(games_list)} jogos ({workers} em paralelo)")
             
-            # Investiga cada jogo
-            for i, game in enumerate(games_list):
-                self.logger.info(f"🎮 Investigando jogo {i+1}/{len(games_list)}: {game.get('teams', 'N/A')}")
-                
-                await self.investigate_game(game)
-                
-                # Pausa entre investigações
-                if i < len(games_list) - 1:
-                    await asyncio.sleep(INVESTIGATION_CONFIG['delay_between_games'])
+            # Os jogos são distribuídos entre workers, cada um com sua página
+            queue = asyncio.Queue()
+            for game in games_list:
+                queue.put_nowait(game)
+            queue.put_nowait(None)
+            
+            # Com limite de taxa, o ritmo vem do limitador compartilhado e não
+            # de uma pausa fixa por worker
+            delay = 0 if self.rate_limiter else INVESTIGATION_CONFIG['delay_between_games']
+            await asyncio.gather(*(
+                self.investigate_from_queue(queue, delay)
+                for _ in range(workers)
+            ))
             
             return await self.save_investigation_results()
         
@@ -224,45 +398,159 @@ class GameInvestigator:
             self.logger.error(f"❌ Erro ao investigar jogos do arquivo: {e}")
             raise
     
+    async def investigate_from_queue(self, queue, delay=0):
+        """Consome jogos de uma fila e os investiga até receber o sentinela None
+        
+        Cada worker usa sua própria página do contexto compartilhado. Ao
+        receber o sentinela, ele é recolocado na fila para os demais workers.
+        
+        Args:
+            queue (asyncio.Queue): Fila de jogos terminada pelo sentinela None
+            delay (float): Pausa do worker após cada jogo, em segundos
+        """
+        if INVESTIGATION_CONFIG['prefetch_next_game']:
+            return await self._investigate_from_queue_prefetching(queue, delay)
+        
+        page = await self.context.new_page()
+        
+        try:
+            while True:
+                game = await queue.get()
+                if game is None:
+                    await queue.put(None)
+                    break
+                
+                await self.investigate_game(game, page)
+                
+                # Pausa do worker para não sobrecarregar o servidor
+                if delay:
+                    await asyncio.sleep(delay)
+        finally:
+            await page.close()
+    
+    async def _investigate_from_queue_prefetching(self, queue, delay):
+        """Como investigate_from_queue, mas com duas páginas alternadas por worker
+        
+        Assim que a página de um jogo termina de carregar, o próximo jogo da
+        fila (se já disponível) começa a carregar na outra página, enquanto o
+        atual aguarda wait_after_load e é extraído.
+        """
+        pages = [await self.context.new_page(), await self.context.new_page()]
+        navigation = None
+        game = await queue.get()
+        
+        try:
+            while game is not None:
+                if navigation is None:
+                    navigation = self._start_navigation(game, pages[0])
+                if navigation is not None:
+                    # Só espera o carregamento; erros são tratados em investigate_game
+                    await asyncio.wait([navigation])
+                
+                current_navigation, navigation = navigation, None
+                try:
+                    next_game = queue.get_nowait()
+                    next_available = True
+                except asyncio.QueueEmpty:
+                    next_game, next_available = None, False
+                
+                if next_available:
+                    if next_game is None:
+                        await queue.put(None)
+                    else:
+                        navigation = self._start_navigation(next_game, pages[1])
+                
+                await self.investigate_game(game, pages[0], current_navigation)
+                
+                # Pausa do worker para não sobrecarregar o servidor
+                if delay:
+                    await asyncio.sleep(delay)
+                
+                pages.reverse()
+                if not next_available:
+                    next_game = await queue.get()
+                    if next_game is None:
+                        await queue.put(None)
+                game = next_game
+        finally:
+            if navigation is not None and not navigation.done():
+                navigation.cancel()
+            for page in pages:
+                await page.close()
+    
     async def save_investigation_results(self):
-        """Salva resultados da investigação"""
-        timestamp = format_timestamp()
-        filename = FILE_PATTERNS['investigation_results'].format(timestamp=timestamp)
+        """Salva resultados da investigação
+        
+        Com INVESTIGATION_CONFIG['stream_results_jsonl'], os jogos já estão no
+        arquivo JSONL gravado durante a investigação; aqui só é gravado o
+        .summary.json com metadados, resumo e falhas, e o caminho do JSONL é
+        retornado.
+        """
+        filename = build_filename('investigation_report', self.run_timestamp)
         filepath = DATA_DIR / filename
         
-        results = {
+        # A serialização roda fora do event loop
+        loop = asyncio.get_running_loop()
+        
+        if self.stream_path:
+            self.stream_file.flush()
+            summary = self._build_investigation_report(None)
+            summary['metadata']['games_file'] = self.stream_path.name
+            summary_file = DATA_DIR / build_filename('investigation_summary', self.run_timestamp)
+            await loop.run_in_executor(None, save_json_file, summary, summary_file)
+            
+            self.logger.info(f"💾 Resultados salvos: {self.stream_path.name}")
+            return str(self.stream_path)
+        
+        report = self._build_investigation_report(self.investigated_games)
+        await loop.run_in_executor(None, save_json_file, report, filepath)
+        
+        self.logger.info(f"💾 Resultados salvos: {filename}")
+        return str(filepath)
+    
+    def _build_investigation_report(self, investigated_games):
+        """Monta o relatório da investigação; sem `investigated_games`, omite a lista de jogos"""
+        investigated, failed, _, success_rate = self.stats
+        report = {
             'metadata': {
                 'investigation_timestamp': datetime.now().isoformat(),
-                'total_investigated': len(self.investigated_games),
-                'total_failed': len(self.failed_investigations),
+                'total_investigated': investigated,
+                'total_failed': failed,
                 'investigator_version': '2.0'
             },
             'summary': {
-                'success_rate': len(self.investigated_games) / (len(self.investigated_games) + len(self.failed_investigations)) * 100 if (len(self.investigated_games) + len(self.failed_investigations)) > 0 else 0,
-                'investigated_games': len(self.investigated_games),
-                'failed_investigations': len(self.failed_investigations)
+                'success_rate': success_rate,
+                'investigated_games': investigated,
+                'failed_investigations': failed
             },
-            'investigated_games': self.investigated_games,
+            'investigated_games': investigated_games,
             'failed_investigations': self.failed_investigations
         }
         
-        save_json_file(results, filepath)
+        if investigated_games is None:
+            del report['investigated_games']
         
-        self.logger.info(f"💾 Resultados salvos: {filename}")
-        return str(filepath)
+        return report
+    
+    @property
+    def stats(self):
+        """Contadores da investigação: (investigados, falhas, total, taxa de sucesso em %)"""
+        investigated = len(self.investigated_games)
+        failed = len(self.failed_investigations)
+        total = investigated + failed
+        return investigated, failed, total, (investigated / total * 100 if total else 0.0)
     
     def print_investigation_summary(self):
         """Imprime resumo da investigação"""
-        total_games = len(self.investigated_games) + len(self.failed_investigations)
-        success_rate = (len(self.investigated_games) / total_games * 100) if total_games > 0 else 0
+        investigated, failed, total_games, success_rate = self.stats
         
         print("\n" + "="*60)
         print("RESUMO DA INVESTIGAÇÃO DE JOGOS")
         print("="*60)
         
         print(f"🎯 Total de jogos processados: {total_games}")
-        print(f"✅ Investigações bem-sucedidas: {len(self.investigated_games)}")
-        print(f"❌ Investigações falharam: {len(self.failed_investigations)}")
+        print(f"✅ Investigações bem-sucedidas: {investigated}")
+        print(f"❌ Investigações falharam: {failed}")
         print(f"📊 Taxa de sucesso: {success_rate:.1f}%")
         
         if self.failed_investigations:
@@ -284,18 +572,38 @@ class GameInvestigator:
                 print(f"      📊 Dados coletados: {len(game['detailed_info'])} seções")
     
     async def cleanup(self):
-        """Limpa recursos do navegador"""
-        if self.browser:
-            await self.browser.close()
+        """Limpa recursos (fecha o contexto; o navegador compartilhado continua aberto)"""
+        if self.stream_file:
+            self.stream_file.close()
+            self.stream_file = None
+        
+        if self.hashes_file:
+            self.hashes_file.close()
+            self.hashes_file = None
+        
+        if self.context:
+            if PLAYWRIGHT_CONFIG['storage_state_path']:
+                try:
+                    await self.context.storage_state(path=PLAYWRIGHT_CONFIG['storage_state_path'])
+                except Exception as e:
+                    self.logger.debug(f"⚠️ Erro ao salvar estado do navegador: {e}")
+            
+            await self.context.close()
+            self.context = None
+            self.page = None
             self.logger.info("🧹 Recursos do navegador liberados")
     
-    async def run_investigation(self, games_file_path):
-        """Executa o processo completo de investigação"""
+    async def run_investigation(self, games_source):
+        """Executa o processo completo de investigação
+        
+        Args:
+            games_source: Caminho do arquivo de jogos ou lista de jogos já extraída
+        """
         self.logger.info("🔍 Iniciando processo de investigação")
         
         try:
             await self.setup_browser()
-            results_file = await self.investigate_games_from_file(games_file_path)
+            results_file = await self.investigate_games_from_file(games_source)
             
             if results_file:
                 self.print_investigation_summary()
@@ -313,10 +621,50 @@ class GameInvestigator:
             await self.cleanup()
 
 # Função de conveniência para uso direto
-async def investigate_games(games_file_path):
-    """Função de conveniência para investigar jogos"""
+async def investigate_games(games_source):
+    """Função de conveniência para investigar jogos (caminho ou lista de jogos)
+    
+    Reaproveita o navegador compartilhado entre chamadas; chame
+    shutdown_pool() ao final da aplicação para fechá-lo.
+    """
+    investigator = GameInvestigator()
+    return await investigator.run_investigation(games_source)
+
+async def extract_and_investigate(workers=None):
+    """Extrai e investiga jogos em pipeline
+    
+    O extrator publica cada jogo válido numa fila assim que é extraído e um
+    grupo de workers investiga os jogos em paralelo, sem esperar o fim da
+    extração. Assim como investigate_games, mantém o navegador compartilhado
+    aberto; chame shutdown_pool() ao final da aplicação.
+    
+    Args:
+        workers (int): Número de workers de investigação (padrão da configuração)
+    
+    Returns:
+        str: Caminho do arquivo de resultados da investigação
+    """
+    from modules.extractor import GameExtractor
+    
+    workers = workers or INVESTIGATION_CONFIG['pipeline_workers']
+    queue = asyncio.Queue(maxsize=INVESTIGATION_CONFIG['pipeline_queue_size'])
+    
+    extractor = GameExtractor()
     investigator = GameInvestigator()
-    return await investigator.run_investigation(games_file_path)
+    
+    try:
+        await investigator.setup_browser()
+        await asyncio.gather(
+            extractor.run_extraction(out_queue=queue),
+            *(investigator.investigate_from_queue(queue) for _ in range(workers))
+        )
+        
+        results_file = await investigator.save_investigation_results()
+        investigator.print_investigation_summary()
+        return results_file
+    
+    finally:
+        await investigator.cleanup()
 
 if __name__ == "__main__":
     import sys
@@ -326,4 +674,11 @@ if __name__ == "__main__":
         sys.exit(1)
     
     games_file = sys.argv[1]
-    asyncio.run(investigate_games(games_file))
\ No newline at end of file
+    
+    async def main():
+        try:
+            await investigate_games(games_file)
+        finally:
+            await shutdown_pool()
+    
+    asyncio.run(main())
\ No newline at end of file
@@ -10,17 +10,123 @@ Este módulo implementa a estratégia de dois níveis:
 Baseado na documentação do Excapper para máxima eficiência.
 """
 
-import json
+import re
 import sys
-import os
+import json
+from bisect import bisect_right
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
-# Adicionar o diretório pai ao path para importações
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.settings import LEAGUE_TIERS, ANALYSIS_RULES_BY_TIER
 
+# Tipos de mercado por prioridade e o método que analisa cada um. Cada
+# alternativa da regex procura um tipo no nome inteiro, e a primeira que casa
+# define o tipo, preservando a prioridade mesmo se o nome contiver mais de um
+# (DOTALL: nomes raspados podem ter quebras de linha)
+_MARKET_TYPES = (
+    ('Match Odds', '_analyze_match_odds'),
+    ('Over/Under', '_analyze_over_under'),
+    ('Both teams to Score', '_analyze_btts'),
+    ('Half', '_analyze_half_markets'),
+)
+_MARKET_TYPE_RE = re.compile('|'.join(
+    f"(?=.*?({re.escape(keyword)}))" for keyword, _ in _MARKET_TYPES
+), re.DOTALL)
+
+# Campo preenchido por cada seleção, pela palavra no nome, em ordem de
+# prioridade; como em _MARKET_TYPE_RE, a primeira alternativa que casa vence
+_SELECTION_FIELDS = (
+    ('type', 'type'),
+    ('summ', 'volume'),
+    ('odds', 'odds'),
+    ('change', 'change'),
+    ('percent', 'percent'),
+    ('time', 'time'),
+    ('score', 'score'),
+)
+_SELECTION_FIELD_BY_NAME = dict(_SELECTION_FIELDS)
+_ODDS_FIELD_INDEX = 2
+
+def _fields_regex(fields):
+    """Regex que identifica a primeira palavra-chave de `fields` presente no nome (mesmo com quebras de linha)."""
+    return re.compile(
+        '|'.join(f"(?=.*?({re.escape(keyword)}))" for keyword, _ in fields),
+        re.DOTALL
+    )
+
+_SELECTION_FIELD_RE = _fields_regex(_SELECTION_FIELDS)
+# Para nomes com 'odds' mas valor não numérico, que seguem para os campos seguintes
+_SELECTION_FIELD_AFTER_ODDS_RE = _fields_regex(_SELECTION_FIELDS[_ODDS_FIELD_INDEX + 1:])
+
+def _selection_field(name: str, value) -> Optional[str]:
+    """Campo de dados do mercado correspondente a uma seleção (ou None)."""
+    # Caso comum: o nome é exatamente a palavra-chave
+    field = _SELECTION_FIELD_BY_NAME.get(name)
+    if field is None:
+        match = _SELECTION_FIELD_RE.match(name)
+        if not match:
+            return None
+        field = _SELECTION_FIELDS[match.lastindex - 1][1]
+    
+    if field == 'odds' and not isinstance(value, (int, float)):
+        match = _SELECTION_FIELD_AFTER_ODDS_RE.match(name)
+        if not match:
+            return None
+        field = _SELECTION_FIELDS[_ODDS_FIELD_INDEX + match.lastindex][1]
+    
+    return field
+
+def extract_market_data(selections: List[Dict]) -> Dict:
+    """Extrai dados estruturados (tipo, volume, odds...) das seleções de um mercado."""
+    data = {
+        'type': None,
+        'volume': None,
+        'odds': None,
+        'change': None,
+        'percent': None,
+        'time': None,
+        'score': None
+    }
+    
+    for selection in selections:
+        value = selection.get('odds')
+        field = _selection_field(selection.get('name', '').lower(), value)
+        if field == 'odds':
+            data['odds'] = float(value)
+        elif field:
+            data[field] = value
+    
+    return data
+
+# Níveis de confiança, indexados pela posição do score entre os limites
+_CONFIDENCE_LEVELS = ("Baixo", "Médio", "Alto")
+
+# Linha de gols no nome do mercado (ex.: "Over/Under 2.5 Goals" -> "2.5")
+_GOAL_LINE_RE = re.compile(r'\d+\.\d+')
+
+# Justificativa quando nenhum mercado analisado vira oportunidade
+_NO_OPPORTUNITY_JUSTIFICATION = (
+    "Após análise completa dos mercados disponíveis, não foram identificadas "
+    "oportunidades claras de valor no momento atual."
+)
+
+# Linhas de gols mais populares (bônus em Over/Under)
+_POPULAR_GOAL_LINES = ('2.5', '1.5')
+
+# Conversões de volume memoizadas pelo texto (str(valor)), que é sempre
+# hashável; erros de conversão propagam e não entram no cache
+@lru_cache(maxsize=4096)
+def _parse_preliminary_volume(text: str) -> int:
+    """Volume da análise preliminar (ex: "45000€" -> 45000)."""
+    return int(text.replace('€', '').replace(',', '').replace('.', ''))
+
+@lru_cache(maxsize=4096)
+def _parse_kairos_volume(text: str) -> int:
+    """Volume da análise KAIROS, removendo símbolos e espaços (ex: "15040 €" -> 15040)."""
+    return int(float(text.replace('€', '').replace(' ', '').replace(',', '')))
+
 def determine_league_tier(league_name: str) -> str:
     """Determina o tier de uma liga baseado nas configurações.
     
@@ -46,7 +152,10 @@ def determine_league_tier(league_name: str) -> str:
     # Padrão é tier3
     return 'tier3'
 
-@dataclass
+# Dataclasses sem __dict__ por instância onde o Python suporta (3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class BettingOpportunity:
     """Representa uma oportunidade de aposta identificada."""
     found: bool
@@ -58,7 +167,7 @@ class BettingOpportunity:
     volume: Optional[str] = None
     odds: Optional[float] = None
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MarketSignal:
     """Representa um sinal detectado na análise preliminar."""
     signal_type: str  # 'money_way', 'drop_odds', 'sharp_bet'
@@ -253,46 +362,16 @@ class PreliminaryAnalyzer:
     
     def _extract_market_data(self, selections: List[Dict]) -> Dict:
         """Extrai dados estruturados das seleções de um mercado."""
-        data = {
-            'type': None,
-            'volume': None,
-            'odds': None,
-            'change': None,
-            'percent': None,
-            'time': None,
-            'score': None
-        }
-        
-        for selection in selections:
-            name = selection.get('name', '').lower()
-            value = selection.get('odds')
-            
-            if 'type' in name:
-                data['type'] = value
-            elif 'summ' in name:
-                data['volume'] = value
-            elif 'odds' in name and isinstance(value, (int, float)):
-                data['odds'] = float(value)
-            elif 'change' in name:
-                data['change'] = value
-            elif 'percent' in name:
-                data['percent'] = value
-            elif 'time' in name:
-                data['time'] = value
-            elif 'score' in name:
-                data['score'] = value
-        
-        return data
-    
-    def _parse_volume(self, volume_str) -> Optional[int]:
-        """Converte string de volume para inteiro."""
+        return extract_market_data(selections)
+    
+    @staticmethod
+    def _parse_volume(volume_str) -> Optional[int]:
+        """Converte string de volume para inteiro (memoizado: volumes se repetem entre mercados)."""
         if not volume_str:
             return None
         
         try:
-            # Remove símbolos e converte (ex: "45000€" -> 45000)
-            volume_clean = str(volume_str).replace('€', '').replace(',', '').replace('.', '')
-            return int(volume_clean)
+            return _parse_preliminary_volume(str(volume_str))
         except (ValueError, TypeError):
             return None
 
@@ -305,6 +384,8 @@ class KairosAnalyzer:
             'medio': 0.6,
             'baixo': 0.4
         }
+        # Limites ordenados para _get_confidence_level: abaixo de 'medio' é Baixo
+        self._confidence_cutoffs = (self.confidence_thresholds['medio'], self.confidence_thresholds['alto'])
         self.preliminary_analyzer = PreliminaryAnalyzer()
     
     def analyze_markets_two_tier(self, market_data: List[Dict]) -> Tuple[List[MarketSignal], Optional[BettingOpportunity]]:
@@ -396,34 +477,32 @@ class KairosAnalyzer:
         print("[KAIROS] 🧠 Iniciando análise inteligente de mercados...")
         
         if not market_data:
-            return BettingOpportunity(
-                found=False,
-                market="N/A",
-                selection="N/A",
-                justification="Nenhum dado de mercado disponível para análise.",
-                confidence_level="Baixo"
-            )
+            return self._no_opportunity("Nenhum dado de mercado disponível para análise.")
         
-        # Analisar cada mercado
-        opportunities = []
+        # Analisar cada mercado, mantendo só a melhor oportunidade (por score de
+        # confiança; em empate, a primeira encontrada)
+        best_opportunity = None
+        best_score = None
         
         for market in market_data:
-            opportunity = self._analyze_single_market(market)
-            if opportunity:
-                opportunities.append(opportunity)
-        
-        # Selecionar a melhor oportunidade
-        if opportunities:
-            best_opportunity = max(opportunities, key=lambda x: x[1])  # Por score de confiança
-            return best_opportunity[0]
-        else:
-            return BettingOpportunity(
-                found=False,
-                market="N/A",
-                selection="N/A",
-                justification="Após análise completa dos mercados disponíveis, não foram identificadas oportunidades claras de valor no momento atual.",
-                confidence_level="Baixo"
-            )
+            result = self._analyze_single_market(market)
+            if result and (best_score is None or result[1] > best_score):
+                best_opportunity, best_score = result
+        
+        if best_opportunity is not None:
+            return best_opportunity
+        
+        return self._no_opportunity(_NO_OPPORTUNITY_JUSTIFICATION)
+    
+    def _no_opportunity(self, justification: str) -> BettingOpportunity:
+        """Resultado de análise sem oportunidade encontrada."""
+        return BettingOpportunity(
+            found=False,
+            market="N/A",
+            selection="N/A",
+            justification=justification,
+            confidence_level="Baixo"
+        )
     
     def _analyze_single_market(self, market: Dict) -> Optional[Tuple[BettingOpportunity, float]]:
         """
@@ -441,23 +520,20 @@ class KairosAnalyzer:
         
         print(f"[KAIROS] 📊 Analisando mercado: {market_name}")
         
+        # Tipo do mercado numa única busca; mercados de outros tipos não são analisados
+        match = _MARKET_TYPE_RE.match(market_name)
+        if not match:
+            return None
+        
         # Extrair dados relevantes das seleções
         market_data = self._extract_market_data(selections)
         
         if not market_data:
             return None
         
-        # Análises específicas por tipo de mercado
-        if 'Match Odds' in market_name:
-            return self._analyze_match_odds(market_name, market_data, links)
-        elif 'Over/Under' in market_name:
-            return self._analyze_over_under(market_name, market_data, links)
-        elif 'Both teams to Score' in market_name:
-            return self._analyze_btts(market_name, market_data, links)
-        elif 'Half' in market_name:
-            return self._analyze_half_markets(market_name, market_data, links)
-        
-        return None
+        # Análise específica do tipo de mercado
+        analyze = getattr(self, _MARKET_TYPES[match.lastindex - 1][1])
+        return analyze(market_name, market_data, links)
     
     def _extract_market_data(self, selections: List[Dict]) -> Dict:
         """
@@ -469,36 +545,7 @@ class KairosAnalyzer:
         Returns:
             Dict com dados estruturados do mercado
         """
-        data = {
-            'type': None,
-            'volume': None,
-            'odds': None,
-            'change': None,
-            'percent': None,
-            'time': None,
-            'score': None
-        }
-        
-        for selection in selections:
-            name = selection.get('name', '').lower()
-            value = selection.get('odds')
-            
-            if 'type' in name:
-                data['type'] = value
-            elif 'summ' in name:
-                data['volume'] = value
-            elif 'odds' in name and isinstance(value, (int, float)):
-                data['odds'] = float(value)
-            elif 'change' in name:
-                data['change'] = value
-            elif 'percent' in name:
-                data['percent'] = value
-            elif 'time' in name:
-                data['time'] = value
-            elif 'score' in name:
-                data['score'] = value
-        
-        return data
+        return extract_market_data(selections)
     
     def _analyze_match_odds(self, market_name: str, data: Dict, links: Dict) -> Optional[Tuple[BettingOpportunity, float]]:
         """
@@ -575,7 +622,7 @@ class KairosAnalyzer:
             justification_parts.append(f"Odds equilibradas de {odds}")
         
         # Linhas de gols mais populares (2.5, 1.5)
-        if goal_line in ['2.5', '1.5']:
+        if goal_line in _POPULAR_GOAL_LINES:
             confidence_score += 0.2
             justification_parts.append(f"Linha {goal_line} com boa liquidez")
         
@@ -670,10 +717,14 @@ class KairosAnalyzer:
         
         return None
     
-    def _parse_volume(self, volume_str) -> Optional[int]:
+    @staticmethod
+    def _parse_volume(volume_str) -> Optional[int]:
         """
         Converte string de volume para número inteiro.
         
+        Memoizado pelo texto do volume, pois os mesmos volumes se repetem
+        entre mercados; aceita qualquer valor, como antes.
+        
         Args:
             volume_str: String como "15040€" ou "15040 €"
             
@@ -684,9 +735,7 @@ class KairosAnalyzer:
             return None
         
         try:
-            # Remove símbolos e espaços
-            clean_str = str(volume_str).replace('€', '').replace(' ', '').replace(',', '')
-            return int(float(clean_str))
+            return _parse_kairos_volume(str(volume_str))
         except (ValueError, TypeError):
             return None
     
@@ -700,9 +749,8 @@ class KairosAnalyzer:
         Returns:
             Linha de gols como "2.5" ou None
         """
-        import re
-        match = re.search(r'(\d+\.\d+)', market_name)
-        return match.group(1) if match else None
+        match = _GOAL_LINE_RE.search(market_name)
+        return match.group(0) if match else None
     
     def _get_confidence_level(self, score: float) -> str:
         """
@@ -714,12 +762,7 @@ class KairosAnalyzer:
         Returns:
             "Alto", "Médio" ou "Baixo"
         """
-        if score >= self.confidence_thresholds['alto']:
-            return "Alto"
-        elif score >= self.confidence_thresholds['medio']:
-            return "Médio"
-        else:
-            return "Baixo"
+        return _CONFIDENCE_LEVELS[bisect_right(self._confidence_cutoffs, score)]
     
     def format_analysis_result(self, opportunity: BettingOpportunity) -> str:
         """
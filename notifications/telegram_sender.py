@@ -11,7 +11,6 @@ Versão: 1.0
 import os
 import asyncio
 import logging
-from datetime import datetime
 from typing import Optional, Dict, Any
 from pathlib import Path
 
@@ -28,6 +27,9 @@ except ImportError:
     print("❌ Biblioteca python-dotenv não encontrada. Execute: pip install python-dotenv")
     raise
 
+from config.telegram_config import render_template
+from utils.helpers import current_timestamp
+
 # Configurar logging
 logger = logging.getLogger(__name__)
 
@@ -95,6 +97,15 @@ class TelegramSender:
         # Fallback para variável de ambiente do sistema
         return os.getenv(key)
     
+    async def close(self) -> None:
+        """
+        Encerra a sessão HTTP do bot
+        """
+        try:
+            await self.bot.shutdown()
+        except Exception as e:
+            logger.warning(f"⚠️ Erro ao encerrar bot Telegram: {e}")
+    
     async def test_connection(self) -> bool:
         """
         Testa a conexão com o Telegram
@@ -163,17 +174,19 @@ class TelegramSender:
         Returns:
             bool: True se enviado com sucesso
         """
-        timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp = current_timestamp('time_only')
         
-        message = f"""🚨 <b>OPORTUNIDADE DETECTADA</b>
-
-🏆 <b>{game_info.get('teams', 'N/A')}</b>
-🏟️ Liga: {game_info.get('league', 'N/A')}
-📊 Mercado: {opportunity.get('market_name', 'N/A')}
-🎯 Seleção: {opportunity.get('selection', 'N/A')}
-💰 Odds: {opportunity.get('odds', 'N/A')}
-🤖 Confiança IA: {opportunity.get('ai_confidence', 0)}%
-⏰ {timestamp}
+        message = render_template(
+            'opportunity_alert',
+            teams=game_info.get('teams', 'N/A'),
+            league=game_info.get('league', 'N/A'),
+            market_name=opportunity.get('market_name', 'N/A'),
+            selection=opportunity.get('selection', 'N/A'),
+            odds=opportunity.get('odds', 'N/A'),
+            ai_confidence=opportunity.get('ai_confidence', 0),
+            timestamp=timestamp
+        )
+        message += f"""
 
 🔗 <a href="{game_info.get('url', '#')}">Ver Jogo</a>"""
         
@@ -273,16 +286,16 @@ Link: {betfair_link}"""
         Returns:
             bool: True se enviado com sucesso
         """
-        timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp = current_timestamp('time_only')
         status_emoji = "✅" if summary.get('games_with_opportunities', 0) > 0 else "📊"
         
-        message = f"""📈 <b>RESUMO DA ANÁLISE</b>
-
-🎮 Total de jogos: {summary.get('total_games', 0)}
-🎯 Oportunidades: {summary.get('games_with_opportunities', 0)}
-⏰ Análise: {timestamp}
-
-{status_emoji} Status: Análise concluída"""
+        message = render_template(
+            'analysis_summary',
+            total_games=summary.get('total_games', 0),
+            games_with_opportunities=summary.get('games_with_opportunities', 0),
+            timestamp=timestamp,
+            status_emoji=status_emoji
+        )
         
         return await self.send_message(message)
     
@@ -296,14 +309,9 @@ Link: {betfair_link}"""
         Returns:
             bool: True se enviado com sucesso
         """
-        timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp = current_timestamp('time_only')
         
-        message = f"""🚨 <b>ERRO NO SISTEMA</b>
-
-❌ {error_message}
-⏰ {timestamp}
-
-🔧 Verificar logs para mais detalhes"""
+        message = render_template('error_alert', error_message=error_message, timestamp=timestamp)
         
         return await self.send_message(message)
     
@@ -314,14 +322,9 @@ Link: {betfair_link}"""
         Returns:
             bool: True se enviado com sucesso
         """
-        timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp = current_timestamp('time_only')
         
-        message = f"""🤖 <b>KAIROS BOT INICIADO</b>
-
-✅ Sistema online
-📱 Telegram conectado
-🧠 IA configurada
-⏰ {timestamp}"""
+        message = render_template('system_start', timestamp=timestamp)
         
         return await self.send_message(message)
 
@@ -353,7 +356,8 @@ async def send_telegram_alert(analysis_result: dict):
         return False
 
 # Funções de conveniência
-async def send_telegram_message(message: str, bot_token: str = None, channel_id: str = None) -> bool:
+async def send_telegram_message(message: str, bot_token: str = None, channel_id: str = None,
+                                sender: Optional[TelegramSender] = None) -> bool:
     """
     Função de conveniência para envio rápido de mensagem
     
@@ -361,30 +365,33 @@ async def send_telegram_message(message: str, bot_token: str = None, channel_id:
         message: Texto da mensagem
         bot_token: Token do bot (opcional)
         channel_id: ID do canal (opcional)
+        sender: Instância existente a reutilizar (opcional)
     
     Returns:
         bool: True se enviado com sucesso
     """
     try:
-        sender = TelegramSender(bot_token, channel_id)
+        sender = sender or TelegramSender(bot_token, channel_id)
         return await sender.send_message(message)
     except Exception as e:
         logger.error(f"❌ Erro ao enviar mensagem: {e}")
         return False
 
-async def send_opportunity_notification(game_info: Dict[str, Any], opportunity: Dict[str, Any]) -> bool:
+async def send_opportunity_notification(game_info: Dict[str, Any], opportunity: Dict[str, Any],
+                                        sender: Optional[TelegramSender] = None) -> bool:
     """
     Função de conveniência para envio de oportunidade
     
     Args:
         game_info: Informações do jogo
         opportunity: Dados da oportunidade
+        sender: Instância existente a reutilizar (opcional)
     
     Returns:
         bool: True se enviado com sucesso
     """
     try:
-        sender = TelegramSender()
+        sender = sender or TelegramSender()
         return await sender.send_opportunity_alert(game_info, opportunity)
     except Exception as e:
         logger.error(f"❌ Erro ao enviar oportunidade: {e}")
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+"""
+KAIROS BOT - Scraper Package
+Coleta de dados do Excapper
+"""
@@ -15,16 +15,11 @@ import json
 from playwright.async_api import async_playwright
 import time
 from datetime import datetime
-import sys
-import os
 import random
 from typing import List, Dict, Optional
 
-# Adicionar o diretório pai ao path para importar módulos
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from modules.kairos_analyzer import analyze_betting_opportunity, preliminary_analysis
 from config.settings import LEAGUE_TIERS, ANALYSIS_RULES_BY_TIER
-from modules.gemini_analyzer import analyze_with_gemini
 
 # Configurações de rate limiting para proteção
 RATE_LIMIT_CONFIG = {
@@ -39,6 +34,30 @@ RATE_LIMIT_CONFIG = {
     ]
 }
 
+def _start_gemini_analysis(processed_markets, game_context):
+    """Inicia a análise Gemini de um jogo sem bloquear o event loop
+    
+    Retorna a task; o resultado é recolhido por _finish_gemini_analyses.
+    """
+    from modules.gemini_analyzer import analyze_with_gemini_async
+    return asyncio.ensure_future(analyze_with_gemini_async(processed_markets, game_context))
+
+async def _finish_gemini_analyses(gemini_tasks):
+    """Aguarda as análises Gemini iniciadas e grava cada uma em game['gemini_analysis']"""
+    for game, task in gemini_tasks:
+        try:
+            gemini_analysis = await task
+            game['gemini_analysis'] = gemini_analysis
+            print(f"✅ Análise Gemini concluída: {game.get('teams', 'N/A')}")
+            
+            # Verificar se Gemini identificou oportunidade adicional
+            if gemini_analysis and "oportunidade" in gemini_analysis.lower():
+                print(f"🎯 Gemini identificou possível oportunidade adicional!")
+        
+        except Exception as e:
+            print(f"⚠️ Erro na análise Gemini: {e}")
+            game['gemini_analysis'] = None
+
 def check_ai_opportunity(analysis_text: str) -> tuple[bool, dict]:
     """
     Verifica se a análise da IA identificou uma oportunidade real e extrai detalhes.
@@ -361,6 +380,7 @@ async def process_multiple_games_safely(live_games_data: List[Dict], page) -> Li
         List[Dict]: Jogos processados com análises
     """
     processed_games = []
+    gemini_tasks = []
     max_games = min(len(live_games_data), RATE_LIMIT_CONFIG['max_games_per_session'])
     
     print(f"\n🎯 Processando {max_games} jogos de forma segura...")
@@ -430,15 +450,10 @@ async def process_multiple_games_safely(live_games_data: List[Dict], page) -> Li
                         'match_status': game.get('match_status', 'N/A')
                     }
                     
-                    print(f"🧠 Executando análise Gemini (movimentação de mercado)...")
-                    gemini_analysis = analyze_with_gemini(processed_markets, game_context)
-                    game['gemini_analysis'] = gemini_analysis
-                    print(f"✅ Análise Gemini concluída")
+                    # Roda em segundo plano, em paralelo com a navegação dos próximos jogos
+                    print(f"🧠 Iniciando análise Gemini (movimentação de mercado)...")
+                    gemini_tasks.append((game, _start_gemini_analysis(processed_markets, game_context)))
                     
-                    # Verificar se Gemini identificou oportunidade adicional
-                    if gemini_analysis and "oportunidade" in gemini_analysis.lower():
-                        print(f"🎯 Gemini identificou possível oportunidade adicional!")
-                        
                 except Exception as e:
                     print(f"⚠️ Erro na análise Gemini: {e}")
                     game['gemini_analysis'] = None
@@ -475,6 +490,8 @@ async def process_multiple_games_safely(live_games_data: List[Dict], page) -> Li
         opportunities_found = sum(1 for g in processed_games if g.get('has_prediction', False))
         print(f"📈 Progresso: {i+1}/{max_games} jogos | {opportunities_found} oportunidades encontradas")
     
+    await _finish_gemini_analyses(gemini_tasks)
+    
     return processed_games
 
 async def process_game_page_tables(page):
@@ -817,7 +834,8 @@ async def get_excapper_live_games() -> list:
                                     'status': 'live' if 'live' in str(processed_markets).lower() else 'prematch'
                                 }
                                 
-                                gemini_analysis = analyze_with_gemini(processed_markets, game_context)
+                                from modules.gemini_analyzer import analyze_with_gemini_async
+                                gemini_analysis = await analyze_with_gemini_async(processed_markets, game_context)
                                 print(f"\n{gemini_analysis}")
                                 
                                 # Marcar jogo como tendo prognóstico
@@ -1000,6 +1018,7 @@ async def run_excapper_analysis():
                 
                 # Processar cada jogo individualmente
                 processed_games = []
+                gemini_tasks = []
                 
                 for i, game in enumerate(games_data[:5], 1):  # Limitar a 5 jogos
                     print(f"\n🎯 Processando jogo {i}/{min(5, len(games_data))}: {game['teams']}")
@@ -1055,15 +1074,10 @@ async def run_excapper_analysis():
                                         'match_status': game.get('match_status', 'N/A')
                                     }
                                     
-                                    print(f"🧠 Executando análise Gemini (movimentação de mercado)...")
-                                    gemini_analysis = analyze_with_gemini(processed_markets, game_context)
-                                    game['gemini_analysis'] = gemini_analysis
-                                    print(f"✅ Análise Gemini concluída")
+                                    # Roda em segundo plano, em paralelo com a navegação dos próximos jogos
+                                    print(f"🧠 Iniciando análise Gemini (movimentação de mercado)...")
+                                    gemini_tasks.append((game, _start_gemini_analysis(processed_markets, game_context)))
                                     
-                                    # Verificar se Gemini identificou oportunidade adicional
-                                    if gemini_analysis and "oportunidade" in gemini_analysis.lower():
-                                        print(f"🎯 Gemini identificou possível oportunidade adicional!")
-                                        
                                 except Exception as e:
                                     print(f"⚠️ Erro na análise Gemini: {e}")
                                     game['gemini_analysis'] = None
@@ -1101,6 +1115,8 @@ async def run_excapper_analysis():
                     if i < min(5, len(games_data)):
                         await page.wait_for_timeout(2000)
                 
+                await _finish_gemini_analyses(gemini_tasks)
+                
                 # Resumo final
                 games_with_opportunities = [g for g in processed_games if g.get('has_prediction', False)]
                 games_without_opportunities = [g for g in processed_games if not g.get('has_prediction', False)]
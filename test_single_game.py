@@ -5,9 +5,6 @@ Script para testar análise de um jogo específico do Excapper
 """
 
 import asyncio
-import sys
-import os
-from pathlib import Path
 from playwright.async_api import async_playwright
 from datetime import datetime
 
@@ -18,9 +15,6 @@ try:
 except ImportError:
     print("⚠️ python-dotenv não encontrado")
 
-# Adicionar diretórios ao path
-sys.path.append(str(Path(__file__).parent))
-
 from modules.kairos_analyzer import analyze_betting_opportunity, preliminary_analysis
 from modules.gemini_analyzer import analyze_with_gemini
 from utils.logger import get_logger
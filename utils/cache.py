@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+KAIROS BOT - Cache Local
+Guarda resultados de raspagem em disco para evitar buscas repetidas
+"""
+
+import os
+import json
+import time
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from config.settings import CACHE_DIR, CACHE_CONFIG
+from utils.helpers import load_json_file, save_json_file, dump_json_line
+
+# Arquivo com o último status HTTP de cada link validado
+LINK_STATUS_FILE = 'link_status.json'
+
+# Respostas HTTP gravadas das páginas de jogos
+HTTP_CACHE_DIR = CACHE_DIR / 'http'
+
+# Cabeçalhos que não valem para o corpo já descomprimido que é gravado
+_UNCACHED_HEADERS = frozenset(['content-encoding', 'content-length', 'transfer-encoding'])
+
+def _cache_path(key: str) -> Path:
+    """Caminho do arquivo de cache para uma chave (ex.: URL)"""
+    return CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+def get_cached(key: str, ttl: float) -> Optional[Any]:
+    """Retorna o valor em cache se ele tiver menos de `ttl` segundos"""
+    path = _cache_path(key)
+    
+    try:
+        age = time.time() - os.stat(path).st_mtime
+    except OSError:
+        return None
+    
+    if age >= ttl:
+        return None
+    
+    try:
+        return load_json_file(path)
+    except Exception:
+        return None
+
+def set_cached(key: str, value: Any) -> None:
+    """Grava um valor no cache"""
+    save_json_file(value, _cache_path(key))
+
+def load_link_statuses(ttl: float) -> Dict[str, int]:
+    """Retorna os status HTTP de links validados há menos de `ttl` segundos"""
+    path = CACHE_DIR / LINK_STATUS_FILE
+    if not os.path.isfile(path):
+        return {}
+    
+    try:
+        entries = load_json_file(path)
+    except Exception:
+        return {}
+    
+    now = time.time()
+    return {
+        link: status
+        for link, (status, checked_at) in entries.items()
+        if now - checked_at < ttl
+    }
+
+def save_link_statuses(statuses: Dict[str, int]) -> None:
+    """Acrescenta status HTTP de links ao cache, com o horário da verificação"""
+    if not statuses:
+        return
+    
+    path = CACHE_DIR / LINK_STATUS_FILE
+    entries = {}
+    if os.path.isfile(path):
+        try:
+            entries = load_json_file(path)
+        except Exception:
+            entries = {}
+    
+    now = time.time()
+    for link, status in statuses.items():
+        entries[link] = [status, now]
+    
+    save_json_file(entries, path)
+
+def _normalize_url(url: str) -> str:
+    """Remove parâmetros voláteis e ordena os demais, para URLs equivalentes terem a mesma chave"""
+    parts = urlsplit(url)
+    ignored = CACHE_CONFIG['http_cache_ignored_params']
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name not in ignored
+    )
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+def http_cache_key(method: str, url: str, body: Optional[bytes] = None) -> str:
+    """Chave de cache de uma requisição: método, URL normalizada e corpo"""
+    digest = hashlib.sha1(f"{method.upper()} {_normalize_url(url)}".encode())
+    if body:
+        digest.update(body)
+    return digest.hexdigest()
+
+def load_http_response(key: str, ttl: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """Retorna a resposta gravada ('status', 'headers', 'body'); com `ttl`, só se tiver menos de `ttl` segundos"""
+    path = HTTP_CACHE_DIR / f"{key}.bin"
+    
+    try:
+        if ttl is not None and time.time() - os.stat(path).st_mtime >= ttl:
+            return None
+        
+        # Primeira linha: status e cabeçalhos em JSON; o restante é o corpo
+        with open(path, 'rb') as f:
+            response = json.loads(f.readline())
+            response['body'] = f.read()
+    except (OSError, ValueError):
+        return None
+    
+    return response
+
+def save_http_response(key: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+    """Grava uma resposta HTTP no cache"""
+    HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    headers = {
+        name: value
+        for name, value in headers.items()
+        if name.lower() not in _UNCACHED_HEADERS
+    }
+    
+    with open(HTTP_CACHE_DIR / f"{key}.bin", 'wb') as f:
+        f.write(dump_json_line({'status': status, 'headers': headers}))
+        f.write(body)
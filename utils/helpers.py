@@ -7,28 +7,68 @@ Utilitários e funções de apoio para o sistema
 
 import re
 import json
+import time
 import hashlib
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Union
 from urllib.parse import urlparse, urljoin
 
-from config.settings import DATA_CONFIG, FILE_CONFIG
+from config.settings import DATA_CONFIG, FILE_CONFIG, get_validator
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson só gera indentação de 2 espaços e sempre grava UTF-8 sem escapes;
+# com outra configuração de FILE_CONFIG a gravação usa o json padrão
+ORJSON_DUMP_ENABLED = (
+    ORJSON_AVAILABLE
+    and FILE_CONFIG['json_indent'] in (None, 2)
+    and not FILE_CONFIG['ensure_ascii']
+    and FILE_CONFIG['encoding'].lower().replace('-', '') == 'utf8'
+)
+if ORJSON_DUMP_ENABLED:
+    _ORJSON_DUMP_OPTIONS = orjson.OPT_NON_STR_KEYS
+    if FILE_CONFIG['json_indent']:
+        _ORJSON_DUMP_OPTIONS |= orjson.OPT_INDENT_2
+
+# Formatos de timestamp suportados
+TIMESTAMP_FORMATS = {
+    'filename': '%Y%m%d_%H%M%S',
+    'display': '%d/%m/%Y %H:%M:%S',
+    'iso': '%Y-%m-%dT%H:%M:%S',
+    'date_only': '%Y-%m-%d',
+    'time_only': '%H:%M:%S'
+}
 
 def format_timestamp(dt=None, format_type='filename'):
     """Formata timestamp para diferentes usos"""
     if dt is None:
         dt = datetime.now()
     
-    formats = {
-        'filename': '%Y%m%d_%H%M%S',
-        'display': '%d/%m/%Y %H:%M:%S',
-        'iso': '%Y-%m-%dT%H:%M:%S',
-        'date_only': '%Y-%m-%d',
-        'time_only': '%H:%M:%S'
-    }
-    
-    return dt.strftime(formats.get(format_type, formats['filename']))
+    return dt.strftime(TIMESTAMP_FORMATS.get(format_type, TIMESTAMP_FORMATS['filename']))
+
+@lru_cache(maxsize=4)
+def _format_epoch_second(epoch_second: int, fmt: str) -> str:
+    """Formata um instante com resolução de segundos (resultado em cache)"""
+    return datetime.fromtimestamp(epoch_second).strftime(fmt)
+
+def current_timestamp(format_type='time_only'):
+    """Retorna o horário atual formatado, reutilizando o valor dentro do mesmo segundo"""
+    fmt = TIMESTAMP_FORMATS.get(format_type, TIMESTAMP_FORMATS['filename'])
+    return _format_epoch_second(int(time.time()), fmt)
+
+# Padrões comuns de data/hora
+_DATETIME_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}',  # DD/MM/YYYY HH:MM
+    r'\d{2}-\d{2}-\d{4}\s+\d{2}:\d{2}',  # DD-MM-YYYY HH:MM
+    r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}',  # YYYY-MM-DD HH:MM
+    r'\d{2}/\d{2}\s+\d{2}:\d{2}',        # DD/MM HH:MM
+))
 
 def validate_game_data(game_data: Dict[str, Any]) -> bool:
     """Valida se os dados do jogo estão completos e corretos"""
@@ -57,15 +97,14 @@ def validate_datetime_format(date_time_str: str) -> bool:
     if not date_time_str:
         return False
     
-    # Padrões comuns de data/hora
-    patterns = [
-        r'\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}',  # DD/MM/YYYY HH:MM
-        r'\d{2}-\d{2}-\d{4}\s+\d{2}:\d{2}',  # DD-MM-YYYY HH:MM
-        r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}',  # YYYY-MM-DD HH:MM
-        r'\d{2}/\d{2}\s+\d{2}:\d{2}',        # DD/MM HH:MM
-    ]
+    date_time_str = date_time_str.strip()
     
-    return any(re.match(pattern, date_time_str.strip()) for pattern in patterns)
+    # Formato do site (DATA_CONFIG['validation_rules']['date_time'])
+    validator = get_validator('date_time')
+    if validator and validator.match(date_time_str):
+        return True
+    
+    return any(pattern.match(date_time_str) for pattern in _DATETIME_PATTERNS)
 
 def clean_text(text: str) -> str:
     """Limpa e normaliza texto"""
@@ -131,9 +170,22 @@ def generate_game_hash(game_data: Dict[str, Any]) -> str:
     
     return hashlib.md5(hash_string.encode()).hexdigest()[:12]
 
+def parse_json(data: Union[str, bytes]) -> Any:
+    """Decodifica JSON de uma string ou bytes (com orjson, se instalado)
+    
+    Erros de decodificação são sempre json.JSONDecodeError, pois o erro do
+    orjson é uma subclasse dele.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def load_json_file(filepath: Path) -> Dict[str, Any]:
     """Carrega arquivo JSON com tratamento de erros"""
     try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(Path(filepath).read_bytes())
+        
         with open(filepath, 'r', encoding=FILE_CONFIG['encoding']) as f:
             return json.load(f)
     except FileNotFoundError:
@@ -149,6 +201,11 @@ def save_json_file(data: Dict[str, Any], filepath: Path) -> None:
         # Cria diretório se não existir
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
+        if ORJSON_DUMP_ENABLED:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=_ORJSON_DUMP_OPTIONS))
+            return
+        
         with open(filepath, 'w', encoding=FILE_CONFIG['encoding']) as f:
             json.dump(
                 data, f,
@@ -158,6 +215,57 @@ def save_json_file(data: Dict[str, Any], filepath: Path) -> None:
     except Exception as e:
         raise Exception(f"Erro ao salvar arquivo: {e}")
 
+def dump_json_line(data: Any) -> bytes:
+    """Serializa um objeto como uma linha JSONL (UTF-8, terminada em quebra de linha)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, ensure_ascii=False) + '\n').encode('utf-8')
+
+def save_json_stream(head: Dict[str, Any], items_key: str, items: Iterable[Any], filepath: Path) -> None:
+    """Salva um objeto JSON cuja lista `items_key` é gravada item a item
+    
+    Os campos de `head` vêm primeiro; cada item é serializado e gravado
+    separadamente, numa linha, sem montar o documento inteiro na memória.
+    """
+    if ORJSON_AVAILABLE:
+        dumps = lambda value: orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        dumps = lambda value: json.dumps(value, ensure_ascii=False).encode('utf-8')
+    
+    try:
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(filepath, 'wb') as f:
+            f.write(b'{')
+            for key, value in head.items():
+                f.write(dumps(key) + b':' + dumps(value) + b',')
+            f.write(dumps(items_key) + b':[')
+            
+            for i, item in enumerate(items):
+                f.write(b',\n' if i else b'\n')
+                f.write(dumps(item))
+            
+            f.write(b'\n]}')
+    except Exception as e:
+        raise Exception(f"Erro ao salvar arquivo: {e}")
+
+def iter_jsonl_file(filepath: Path) -> Iterator[Any]:
+    """Percorre um arquivo JSONL objeto a objeto, sem carregá-lo inteiro"""
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    try:
+        with open(filepath, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo não encontrado: {filepath}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Erro ao decodificar JSON: {e}")
+
+def load_jsonl_file(filepath: Path) -> List[Any]:
+    """Carrega um arquivo JSONL (um objeto JSON por linha)"""
+    return list(iter_jsonl_file(filepath))
+
 def filter_games_by_criteria(games: List[Dict], criteria: Dict[str, Any]) -> List[Dict]:
     """Filtra jogos baseado em critérios específicos"""
     filtered_games = []
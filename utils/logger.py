@@ -10,7 +10,7 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-from config.settings import LOGGING_CONFIG, LOGS_DIR, FILE_PATTERNS
+from config.settings import LOGGING_CONFIG, LOGS_DIR, build_filename
 
 def setup_logging():
     """Configura o sistema de logging"""
@@ -19,7 +19,7 @@ def setup_logging():
     
     # Nome do arquivo de log com data
     date = datetime.now().strftime('%Y%m%d')
-    log_filename = FILE_PATTERNS['log_file'].format(date=date)
+    log_filename = build_filename('log_file', date)
     log_filepath = LOGS_DIR / log_filename
     
     # Configuração do formatter
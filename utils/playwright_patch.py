@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+KAIROS BOT - Ajuste de desempenho do Playwright
+Evita a coleta de pilha (inspect.stack) que o Playwright faz a cada chamada
+"""
+
+import os
+import inspect
+import types
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Variável de ambiente que habilita o ajuste (opt-in)
+PW_FAST_ENV = 'KAIROS_PW_FAST'
+
+_applied = False
+
+def apply_playwright_fast_patch():
+    """Desativa o inspect.stack() usado pelo Playwright para enriquecer tracebacks
+    
+    O Playwright coleta a pilha completa a cada chamada da API, o que consome
+    boa parte da CPU em execuções com muitas chamadas ao navegador. Só é
+    aplicado quando KAIROS_PW_FAST=1; os tracebacks do Playwright deixam de
+    apontar a linha do código chamador.
+    
+    Returns:
+        bool: True se o ajuste está ativo
+    """
+    global _applied
+    
+    if _applied:
+        return True
+    
+    if os.environ.get(PW_FAST_ENV) != '1':
+        return False
+    
+    try:
+        from playwright._impl import _connection
+    except ImportError:
+        return False
+    
+    if not hasattr(_connection, 'inspect'):
+        logger.warning("⚠️ Versão do Playwright não suportada pelo ajuste de desempenho")
+        return False
+    
+    fast_inspect = types.ModuleType('inspect')
+    fast_inspect.__dict__.update(inspect.__dict__)
+    fast_inspect.stack = lambda context=1: []
+    _connection.inspect = fast_inspect
+    
+    _applied = True
+    logger.info("⚡ Coleta de pilha do Playwright desativada (KAIROS_PW_FAST=1)")
+    return True
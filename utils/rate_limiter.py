@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+KAIROS BOT - Limitador de Taxa
+Distribui um orçamento de requisições por minuto entre várias tarefas asyncio
+"""
+
+import asyncio
+import time
+
+class AsyncRateLimiter:
+    """Libera no máximo `rate` chamadas a cada `period` segundos, igualmente espaçadas
+    
+    O orçamento é compartilhado: com vários workers usando a mesma instância,
+    cada um ocupa o próximo horário livre em vez de pausar por conta própria.
+    """
+    
+    def __init__(self, rate: float, period: float = 60.0):
+        if rate <= 0:
+            raise ValueError("rate deve ser positivo")
+        self.interval = period / rate
+        self._next_slot = 0.0
+    
+    async def wait(self) -> None:
+        """Aguarda o próximo horário livre"""
+        now = time.monotonic()
+        # Reserva o horário antes de aguardar, para que outras tarefas peguem os seguintes
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    async def __aenter__(self):
+        await self.wait()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False